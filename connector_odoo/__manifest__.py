@@ -33,9 +33,13 @@
         "views/odoo_backend.xml",
         "wizards/import_external_id.xml",
         "wizards/import_single_field_legacy.xml",
+        "wizards/channel_allocation.xml",
         "wizards/wizards_menu.xml",
         "views/product_uom.xml",
         "views/odoo_connector_menus.xml",
+        "views/queue_job.xml",
+        "views/odoo_reports.xml",
+        "views/odoo_job_spawner.xml",
         "views/product_category.xml",
         "views/product.xml",
         "views/product_template.xml",
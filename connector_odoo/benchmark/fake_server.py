@@ -0,0 +1,829 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+"""
+Stand-in for a remote Odoo 12.0 database, for offline benchmarks.
+
+It speaks the ``/jsonrpc`` protocol used by ``OdooAPI``: ``common.login``
+and ``common.version``, and ``object.execute_kw`` with ``search_read``,
+``read``, ``search``, ``search_count``, ``fields_get``, ``name_get``,
+``create``, ``write`` and ``unlink``. The records are generated from a
+seed, so two servers built with the same parameters serve the same data.
+
+It only depends on the standard library, run it with::
+
+    python connector_odoo/benchmark/fake_server.py --port 8169 --latency 20
+
+and point a backend to ``http://localhost:8169``, database ``fake``,
+login ``admin`` and password ``admin``. ``GET /stats`` returns the
+number of calls served by model and method, ``POST /stats/reset``
+resets them.
+"""
+
+import argparse
+import base64
+import fnmatch
+import json
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from operator import ge, gt, le, lt
+
+_logger = logging.getLogger(__name__)
+
+SERVER_VERSION = "12.0"
+
+DEFAULT_SIZES = {
+    "partners": 1000,
+    "templates": 500,
+    "variants": 2,
+    "orders": 200,
+    "lines": 5,
+    "boms": 100,
+    "addresses": 200,
+}
+
+COMPARISONS = {
+    ">": gt,
+    ">=": ge,
+    "<": lt,
+    "<=": le,
+}
+
+# Fields holding images in the generated records
+IMAGE_FIELDS = ("image", "image_main", "image_medium", "image_small")
+
+
+class FakeOdooError(Exception):
+    """Error returned to the client in the JSON-RPC error member"""
+
+
+def _m2o(record, name_field="name"):
+    return [record["id"], record[name_field]] if record else False
+
+
+class DatasetBuilder(object):
+    """Generate the synthetic records of the fake database"""
+
+    def __init__(self, seed=42, sizes=None, image_size=0):
+        self.random = random.Random(seed)
+        self.sizes = dict(DEFAULT_SIZES, **(sizes or {}))
+        self.image_size = image_size
+        self.models = {}
+        self.start_date = datetime(2023, 1, 1)
+
+    def _date(self):
+        date = self.start_date + timedelta(
+            seconds=self.random.randint(0, 365 * 24 * 3600)
+        )
+        return date.strftime("%Y-%m-%d %H:%M:%S")
+
+    def _image(self):
+        if not self.image_size:
+            return False
+        data = bytes(self.random.getrandbits(8) for _ in range(self.image_size))
+        return base64.b64encode(data).decode()
+
+    def _add(self, model, values):
+        records = self.models.setdefault(model, {})
+        record_id = len(records) + 1
+        record = {"id": record_id, "create_date": self._date()}
+        record["write_date"] = max(record["create_date"], self._date())
+        record.update(values)
+        record.setdefault("display_name", record.get("name", str(record_id)))
+        records[record_id] = record
+        return record
+
+    def _pick(self, model):
+        return self.random.choice(list(self.models[model].values()))
+
+    def _build_reference_data(self):
+        turkey = self._add(
+            "res.country", {"name": "Turkey", "code": "TR", "active": True}
+        )
+        for code, name in (("DE", "Germany"), ("FR", "France"), ("US", "USA")):
+            self._add("res.country", {"name": name, "code": code, "active": True})
+        for index, name in enumerate(("Istanbul", "Ankara", "Izmir", "Bursa"), 1):
+            self._add(
+                "res.country.state",
+                {"name": name, "code": str(index), "country_id": _m2o(turkey)},
+            )
+        for name, rate in (("TRY", 1.0), ("EUR", 0.03), ("USD", 0.033)):
+            self._add(
+                "res.currency",
+                {"name": name, "symbol": name, "rate": rate, "active": True},
+            )
+        try_currency = self.models["res.currency"][1]
+        self._add(
+            "product.pricelist",
+            {
+                "name": "Public Pricelist",
+                "currency_id": _m2o(try_currency),
+                "active": True,
+                "item_ids": [],
+            },
+        )
+        self._add("account.account.type", {"name": "Receivable", "type": "receivable"})
+        self._add("account.account.type", {"name": "Payable", "type": "payable"})
+        self._add(
+            "product.price.type",
+            {"name": "Sale Price", "field": "list_price", "currency": [1, "TRY"]},
+        )
+        unit = self._add("uom.category", {"name": "Unit"})
+        weight = self._add("uom.category", {"name": "Weight"})
+        for name, category, uom_type, factor in (
+            ("Units", unit, "reference", 1.0),
+            ("Dozens", unit, "bigger", 1 / 12.0),
+            ("kg", weight, "reference", 1.0),
+            ("g", weight, "smaller", 1000.0),
+        ):
+            self._add(
+                "uom.uom",
+                {
+                    "name": name,
+                    "category_id": _m2o(category),
+                    "uom_type": uom_type,
+                    "factor": factor,
+                    "factor_inv": 1 / factor,
+                    "rounding": 0.01,
+                    "active": True,
+                },
+            )
+        root = self._add(
+            "product.category",
+            {"name": "All", "parent_id": False, "complete_name": "All"},
+        )
+        for index in range(1, 11):
+            name = "Category {}".format(index)
+            self._add(
+                "product.category",
+                {
+                    "name": name,
+                    "parent_id": _m2o(root),
+                    "complete_name": "All / {}".format(name),
+                },
+            )
+        color = self._add(
+            "product.attribute", {"name": "Color", "create_variant": "always"}
+        )
+        for name in ("Red", "Green", "Blue", "Black"):
+            self._add(
+                "product.attribute.value",
+                {"name": name, "attribute_id": _m2o(color), "sequence": 1},
+            )
+
+    def _build_addresses(self):
+        """District, region and neighbour of the Turkish address models"""
+        states = list(self.models["res.country.state"].values())
+        for index in range(1, self.sizes["addresses"] + 1):
+            district = self._add(
+                "address.district",
+                {
+                    "name": "District {}".format(index),
+                    "state_id": _m2o(self.random.choice(states)),
+                },
+            )
+            region = self._add(
+                "address.region",
+                {"name": "Region {}".format(index), "district_id": _m2o(district)},
+            )
+            self._add(
+                "address.neighbour",
+                {
+                    "name": "Neighbour {}".format(index),
+                    "region_id": _m2o(region),
+                    "code": "{:05d}".format(index),
+                },
+            )
+
+    def _build_partners(self):
+        countries = list(self.models["res.country"].values())
+        states = list(self.models["res.country.state"].values())
+        companies = []
+        for index in range(1, self.sizes["partners"] + 1):
+            is_company = not companies or self.random.random() < 0.3
+            parent = False if is_company else self.random.choice(companies)
+            partner = self._add(
+                "res.partner",
+                {
+                    "name": "Partner {}".format(index),
+                    "is_company": is_company,
+                    "company_type": "company" if is_company else "person",
+                    "parent_id": _m2o(parent),
+                    "type": "contact",
+                    "ref": "P{:06d}".format(index),
+                    "street": "{} Test Street".format(index),
+                    "street2": False,
+                    "city": "Istanbul",
+                    "zip": "{:05d}".format(self.random.randint(10000, 99999)),
+                    "country_id": _m2o(countries[0]),
+                    "state_id": _m2o(self.random.choice(states)),
+                    "email": "partner{}@example.com".format(index),
+                    "phone": "+90 212 000 {:04d}".format(index % 10000),
+                    "mobile": False,
+                    "vat": False,
+                    "lang": "tr_TR",
+                    "website": False,
+                    "comment": False,
+                    "customer": True,
+                    "supplier": self.random.random() < 0.1,
+                    "active": True,
+                    "property_product_pricelist": [1, "Public Pricelist"],
+                    "image": self._image(),
+                },
+            )
+            if is_company:
+                companies.append(partner)
+
+    def _build_products(self):
+        uoms = self.models["uom.uom"]
+        categories = list(self.models["product.category"].values())[1:]
+        values = list(self.models["product.attribute.value"].values())
+        for index in range(1, self.sizes["templates"] + 1):
+            variants = max(1, self.sizes["variants"])
+            template = self._add(
+                "product.template",
+                {
+                    "name": "Product {}".format(index),
+                    "default_code": "T{:06d}".format(index),
+                    "type": "product",
+                    "categ_id": _m2o(self.random.choice(categories), "complete_name"),
+                    "uom_id": _m2o(uoms[1]),
+                    "uom_po_id": _m2o(uoms[1]),
+                    "list_price": round(self.random.uniform(1, 1000), 2),
+                    "standard_price": round(self.random.uniform(1, 500), 2),
+                    "sale_ok": True,
+                    "purchase_ok": True,
+                    "active": True,
+                    "weight": round(self.random.uniform(0.1, 20), 2),
+                    "volume": 0.0,
+                    "barcode": False,
+                    "description_sale": "Description of product {}".format(index),
+                    "taxes_id": [],
+                    "supplier_taxes_id": [],
+                    "attribute_line_ids": [],
+                    "feature_line_ids": [],
+                    "website_attachment_ids": [],
+                    "accessory_product_ids": [],
+                    "product_brand_id": False,
+                    "product_variant_ids": [],
+                    "website_published": True,
+                },
+            )
+            for image_field in IMAGE_FIELDS:
+                template[image_field] = self._image()
+            for variant_index in range(variants):
+                attribute_values = (
+                    [values[variant_index % len(values)]["id"]] if variants > 1 else []
+                )
+                product = self._add(
+                    "product.product",
+                    {
+                        "name": template["name"],
+                        "product_tmpl_id": _m2o(template),
+                        "default_code": "{}-{}".format(
+                            template["default_code"], variant_index
+                        ),
+                        "barcode": False,
+                        "attribute_value_ids": attribute_values,
+                        "lst_price": template["list_price"],
+                        "standard_price": template["standard_price"],
+                        "weight": template["weight"],
+                        "uom_id": template["uom_id"],
+                        "categ_id": template["categ_id"],
+                        "active": True,
+                        "v_cari_urun": False,
+                    },
+                )
+                for image_field in IMAGE_FIELDS:
+                    product[image_field] = template[image_field]
+                template["product_variant_ids"].append(product["id"])
+
+    def _build_boms(self):
+        templates = list(self.models.get("product.template", {}).values())
+        products = list(self.models.get("product.product", {}).values())
+        if not templates or not products:
+            return
+        for index in range(1, self.sizes["boms"] + 1):
+            template = self.random.choice(templates)
+            bom = self._add(
+                "mrp.bom",
+                {
+                    "name": template["name"],
+                    "code": "BOM{:05d}".format(index),
+                    "type": "normal",
+                    "product_tmpl_id": _m2o(template),
+                    "product_id": False,
+                    "product_qty": 1.0,
+                    "product_uom_id": template["uom_id"],
+                    "bom_line_ids": [],
+                    "active": True,
+                },
+            )
+            for _line in range(self.random.randint(1, 5)):
+                product = self.random.choice(products)
+                line = self._add(
+                    "mrp.bom.line",
+                    {
+                        "bom_id": _m2o(bom, "code"),
+                        "product_id": _m2o(product),
+                        "product_qty": float(self.random.randint(1, 10)),
+                        "product_uom_id": product["uom_id"],
+                    },
+                )
+                bom["bom_line_ids"].append(line["id"])
+
+    def _build_sale_orders(self):
+        partners = list(self.models.get("res.partner", {}).values())
+        products = list(self.models.get("product.product", {}).values())
+        if not partners or not products:
+            return
+        pricelist = self.models["product.pricelist"][1]
+        for index in range(1, self.sizes["orders"] + 1):
+            partner = self.random.choice(partners)
+            order = self._add(
+                "sale.order",
+                {
+                    "name": "SO{:06d}".format(index),
+                    "partner_id": _m2o(partner),
+                    "partner_invoice_id": _m2o(partner),
+                    "partner_shipping_id": _m2o(partner),
+                    "pricelist_id": _m2o(pricelist),
+                    "currency_id": pricelist["currency_id"],
+                    "date_order": self._date(),
+                    "state": self.random.choice(["draft", "sent", "sale", "done"]),
+                    "user_id": False,
+                    "payment_term_id": False,
+                    "order_line": [],
+                    "amount_total": 0.0,
+                },
+            )
+            for _line in range(self.sizes["lines"]):
+                product = self.random.choice(products)
+                quantity = float(self.random.randint(1, 20))
+                line = self._add(
+                    "sale.order.line",
+                    {
+                        "name": product["name"],
+                        "order_id": _m2o(order),
+                        "product_id": _m2o(product),
+                        "product_uom_qty": quantity,
+                        "product_uom": product["uom_id"],
+                        "price_unit": product["lst_price"],
+                        "discount": 0.0,
+                        "tax_id": [],
+                    },
+                )
+                order["order_line"].append(line["id"])
+                order["amount_total"] += quantity * product["lst_price"]
+
+    def build(self):
+        self._build_reference_data()
+        self._build_addresses()
+        self._build_partners()
+        self._build_products()
+        self._build_boms()
+        self._build_sale_orders()
+        return self.models
+
+
+class DomainEvaluator(object):
+    """Evaluate Odoo domains (prefix notation) on the generated records"""
+
+    def __init__(self, domain):
+        self.domain = [
+            tuple(term) if isinstance(term, list) else term for term in domain
+        ]
+
+    def mentions(self, field_name):
+        return any(
+            isinstance(term, tuple) and term[0] == field_name for term in self.domain
+        )
+
+    @staticmethod
+    def _value(record, field_name):
+        value = record.get(field_name.split(".")[0], False)
+        if isinstance(value, list) and len(value) == 2 and isinstance(value[1], str):
+            return value[0]  # many2one
+        return value
+
+    @staticmethod
+    def _match_like(value, operator, target):
+        if value is False or target is False:
+            return False
+        value, pattern = str(value), str(target)
+        if operator.startswith("="):
+            pattern = pattern.replace("%", "*").replace("_", "?")
+        else:
+            pattern = "*{}*".format(pattern)
+        if operator.endswith("ilike"):
+            value, pattern = value.lower(), pattern.lower()
+        return fnmatch.fnmatchcase(value, pattern)
+
+    def _match_leaf(self, record, leaf):
+        field_name, operator, target = leaf
+        value = self._value(record, field_name)
+        if isinstance(value, list):
+            # x2many: match when one of the ids matches
+            if operator in ("=", "in"):
+                targets = target if isinstance(target, (list, tuple)) else [target]
+                return bool(set(value) & set(targets)) or (not value and not target)
+            if operator in ("!=", "not in"):
+                targets = target if isinstance(target, (list, tuple)) else [target]
+                return not set(value) & set(targets)
+            raise FakeOdooError("Unsupported x2many operator {}".format(operator))
+        if operator in ("=", "!="):
+            equal = value == target or (not value and not target)
+            return equal if operator == "=" else not equal
+        if operator in ("in", "not in"):
+            return (value in target) == (operator == "in")
+        if operator in ("like", "ilike", "=like", "=ilike"):
+            return self._match_like(value, operator, target)
+        if operator in COMPARISONS:
+            if value is False or value is None:
+                return False
+            return COMPARISONS[operator](value, target)
+        raise FakeOdooError("Unsupported operator {}".format(operator))
+
+    def _evaluate(self, record, position):
+        term = self.domain[position]
+        if term == "!":
+            result, position = self._evaluate(record, position + 1)
+            return not result, position
+        if term in ("&", "|"):
+            left, position = self._evaluate(record, position + 1)
+            right, position = self._evaluate(record, position)
+            return (left and right if term == "&" else left or right), position
+        if term in ((1, "=", 1), (0, "=", 1)):
+            return term[0] == 1, position + 1
+        return self._match_leaf(record, term), position + 1
+
+    def match(self, record):
+        position = 0
+        while position < len(self.domain):
+            # the terms which are not combined are joined with AND
+            result, position = self._evaluate(record, position)
+            if not result:
+                return False
+        return True
+
+
+class FakeOdoo(object):
+    """The fake database: authentication and the ORM methods"""
+
+    def __init__(
+        self,
+        models,
+        db="fake",
+        login="admin",
+        password="admin",
+        latency=0.0,
+        jitter=0.0,
+        seed=42,
+    ):
+        self.models = models
+        self.db = db
+        self.login = login
+        self.password = password
+        self.uid = 2
+        self.latency = latency
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    def _count(self, key):
+        with self.lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+
+    def _sleep(self):
+        if self.latency or self.jitter:
+            with self.lock:
+                jitter = self.random.uniform(0, self.jitter)
+            time.sleep((self.latency + jitter) / 1000.0)
+
+    def _records(self, model):
+        return self.models.setdefault(model, {})
+
+    def _check_auth(self, db, uid, password):
+        if db != self.db or uid not in (self.uid, self.login):
+            raise FakeOdooError("Access Denied")
+        if password != self.password:
+            raise FakeOdooError("Access Denied")
+
+    def _project(self, record, fields):
+        if not fields:
+            return dict(record)
+        result = {"id": record["id"]}
+        for field_name in fields:
+            if field_name == "__last_update":
+                result[field_name] = record["write_date"]
+            else:
+                result[field_name] = record.get(field_name, False)
+        return result
+
+    def _sort(self, records, order):
+        for part in reversed([part.strip() for part in (order or "id").split(",")]):
+            field_name, __, direction = part.partition(" ")
+            records.sort(
+                key=lambda record: (
+                    record.get(field_name) is False,
+                    self._sort_key(record.get(field_name)),
+                ),
+                reverse=direction.strip().lower() == "desc",
+            )
+        return records
+
+    @staticmethod
+    def _sort_key(value):
+        if isinstance(value, list):
+            return value[0] if value else 0
+        return value if value is not False else 0
+
+    def _search(self, model, domain, offset=0, limit=None, order=None):
+        evaluator = DomainEvaluator(domain or [])
+        records = self._records(model).values()
+        sample = next(iter(records), {})
+        if "active" in sample and not evaluator.mentions("active"):
+            records = [record for record in records if record.get("active")]
+        records = self._sort(
+            [record for record in records if evaluator.match(record)], order
+        )
+        offset = offset or 0
+        return records[offset : offset + limit if limit else None]
+
+    def _fields_get(self, model):
+        sample = next(iter(self._records(model).values()), {})
+        description = {}
+        for field_name, value in sample.items():
+            if isinstance(value, bool):
+                field_type = "boolean"
+            elif isinstance(value, int):
+                field_type = "integer"
+            elif isinstance(value, float):
+                field_type = "float"
+            elif isinstance(value, list) and len(value) == 2:
+                field_type = "many2one"
+            elif isinstance(value, list):
+                field_type = "many2many"
+            else:
+                field_type = "char"
+            description[field_name] = {"type": field_type, "string": field_name}
+        return description
+
+    def execute_kw(self, model, method, args=None, kwargs=None):
+        args = list(args or [])
+        kwargs = dict(kwargs or {})
+        kwargs.pop("context", None)
+        if method == "search_read":
+            domain = args[0] if args else kwargs.pop("domain", [])
+            records = self._search(
+                model,
+                domain,
+                offset=kwargs.get("offset"),
+                limit=kwargs.get("limit"),
+                order=kwargs.get("order"),
+            )
+            return [self._project(record, kwargs.get("fields")) for record in records]
+        if method == "read":
+            ids = args[0] if args else kwargs.get("ids", [])
+            ids = ids if isinstance(ids, list) else [ids]
+            fields = args[1] if len(args) > 1 else kwargs.get("fields")
+            records = self._records(model)
+            return [
+                self._project(records[res_id], fields)
+                for res_id in ids
+                if res_id in records
+            ]
+        if method == "search":
+            domain = args[0] if args else kwargs.pop("domain", [])
+            records = self._search(
+                model,
+                domain,
+                offset=kwargs.get("offset"),
+                limit=kwargs.get("limit"),
+                order=kwargs.get("order"),
+            )
+            return [record["id"] for record in records]
+        if method == "search_count":
+            domain = args[0] if args else kwargs.pop("domain", [])
+            return len(self._search(model, domain))
+        if method == "fields_get":
+            return self._fields_get(model)
+        if method == "name_get":
+            records = self._records(model)
+            return [
+                [res_id, records[res_id].get("display_name", "")]
+                for res_id in args[0]
+                if res_id in records
+            ]
+        if method == "create":
+            values = args[0] if args else kwargs
+            with self.lock:
+                records = self._records(model)
+                record_id = max(records, default=0) + 1
+                now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+                records[record_id] = dict(
+                    values, id=record_id, create_date=now, write_date=now
+                )
+            return record_id
+        if method == "write":
+            ids, values = args[0], args[1]
+            ids = ids if isinstance(ids, list) else [ids]
+            now = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+            with self.lock:
+                for res_id in ids:
+                    record = self._records(model).get(res_id)
+                    if record is not None:
+                        record.update(values, write_date=now)
+            return True
+        if method == "unlink":
+            ids = args[0] if isinstance(args[0], list) else [args[0]]
+            with self.lock:
+                for res_id in ids:
+                    self._records(model).pop(res_id, None)
+            return True
+        raise FakeOdooError("Method {}.{} is not supported".format(model, method))
+
+    def dispatch(self, params):
+        service = params.get("service")
+        method = params.get("method")
+        args = params.get("args") or []
+        self._sleep()
+        if service == "common":
+            self._count("common.{}".format(method))
+            if method == "version":
+                return {
+                    "server_version": SERVER_VERSION,
+                    "server_version_info": [12, 0, 0, "final", 0, ""],
+                    "server_serie": SERVER_VERSION,
+                    "protocol_version": 1,
+                }
+            if method in ("login", "authenticate"):
+                db, login, password = args[:3]
+                if (db, login, password) == (self.db, self.login, self.password):
+                    return self.uid
+                return False
+            raise FakeOdooError("Method common.{} is not supported".format(method))
+        if service == "object" and method == "execute_kw":
+            db, uid, password, model, model_method = args[:5]
+            self._check_auth(db, uid, password)
+            self._count("{}.{}".format(model, model_method))
+            return self.execute_kw(
+                model,
+                model_method,
+                args[5] if len(args) > 5 else [],
+                args[6] if len(args) > 6 else {},
+            )
+        raise FakeOdooError("Service {}.{} is not supported".format(service, method))
+
+
+class FakeOdooHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, data, status=200):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/stats":
+            with self.server.fake_odoo.lock:
+                return self._send_json(dict(self.server.fake_odoo.stats))
+        return self._send_json({"error": "Not found"}, status=404)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self.path == "/stats/reset":
+            with self.server.fake_odoo.lock:
+                self.server.fake_odoo.stats.clear()
+            return self._send_json({})
+        if self.path != "/jsonrpc":
+            return self._send_json({"error": "Not found"}, status=404)
+        response = {"jsonrpc": "2.0", "id": payload.get("id")}
+        try:
+            response["result"] = self.server.fake_odoo.dispatch(
+                payload.get("params") or {}
+            )
+        except Exception as exc:
+            response["error"] = {
+                "code": 200,
+                "message": "Odoo Server Error",
+                "data": {"name": type(exc).__name__, "message": str(exc)},
+            }
+        return self._send_json(response)
+
+    def log_message(self, format, *args):
+        _logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class FakeOdooServer(object):
+    """Run the fake database behind a threaded HTTP server"""
+
+    def __init__(self, fake_odoo, host="127.0.0.1", port=0):
+        self.fake_odoo = fake_odoo
+        self.httpd = ThreadingHTTPServer((host, port), FakeOdooHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.fake_odoo = fake_odoo
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return "http://{}:{}".format(host, port)
+
+    def start(self):
+        """Serve in a background thread"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self.thread:
+            self.thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def build_server(
+    host="127.0.0.1",
+    port=0,
+    seed=42,
+    sizes=None,
+    image_size=0,
+    latency=0.0,
+    jitter=0.0,
+    db="fake",
+    login="admin",
+    password="admin",
+):
+    """Generate a dataset and return a FakeOdooServer serving it"""
+    models = DatasetBuilder(seed=seed, sizes=sizes, image_size=image_size).build()
+    fake_odoo = FakeOdoo(
+        models,
+        db=db,
+        login=login,
+        password=password,
+        latency=latency,
+        jitter=jitter,
+        seed=seed,
+    )
+    return FakeOdooServer(fake_odoo, host=host, port=port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8169)
+    parser.add_argument("--db", default="fake")
+    parser.add_argument("--login", default="admin")
+    parser.add_argument("--password", default="admin")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="Delay of each call in ms"
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="Random extra delay in ms"
+    )
+    parser.add_argument(
+        "--image-size", type=int, default=0, help="Size of the images in bytes"
+    )
+    for name, size in DEFAULT_SIZES.items():
+        parser.add_argument("--{}".format(name), type=int, default=size)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    server = build_server(
+        host=args.host,
+        port=args.port,
+        seed=args.seed,
+        sizes={name: getattr(args, name) for name in DEFAULT_SIZES},
+        image_size=args.image_size,
+        latency=args.latency,
+        jitter=args.jitter,
+        db=args.db,
+        login=args.login,
+        password=args.password,
+    )
+    counts = {model: len(records) for model, records in server.fake_odoo.models.items()}
+    _logger.info("Serving %s on %s: %s", args.db, server.url, counts)
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
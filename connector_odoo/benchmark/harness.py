@@ -0,0 +1,276 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+"""
+Benchmark of the batch imports, against the fake Odoo server.
+
+For each dataset size and binding model, a fake server is started, a
+backend pointing to it is created and the batch import of the model is
+run with ``queue_job__no_delay``, so the chunk jobs are executed inline.
+The run is measured then rolled back: the commits of the importers are
+replaced by flushes, which leaves the database as it was.
+
+Run it from an Odoo shell on a database where the addon is installed::
+
+    from odoo.addons.connector_odoo.benchmark import harness
+    harness.run(env, sizes=[100, 1000], output="/tmp/bench-new.json")
+
+and compare two result files, without Odoo::
+
+    python connector_odoo/benchmark/harness.py compare old.json new.json
+
+The memory peaks are measured with tracemalloc, which slows down the
+imports: compare runs made with the same options only.
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from unittest import mock
+
+if __package__:
+    from .fake_server import build_server
+else:  # run as a script
+    from fake_server import build_server
+
+_logger = logging.getLogger(__name__)
+
+BENCHMARK_MODELS = [
+    "odoo.res.partner",
+    "odoo.product.template",
+    "odoo.product.product",
+    "odoo.sale.order",
+    "odoo.mrp.bom",
+    "odoo.address.district",
+    "odoo.address.region",
+    "odoo.address.neighbour",
+]
+
+BENCHMARK_SIZES = [100, 1000]
+
+# Metrics compared between two result files, and whether a higher value
+# is better
+METRICS = {
+    "records_per_second": True,
+    "rpc_per_record": False,
+    "sql_per_record": False,
+    "peak_memory_kb": False,
+}
+
+
+def _dataset_sizes(size):
+    """Sizes of the fake dataset giving about ``size`` records per model"""
+    return {
+        "partners": size,
+        "templates": max(1, size // 2),
+        "variants": 2,
+        "orders": max(1, size // 5),
+        "lines": 5,
+        "boms": size,
+        "addresses": size,
+    }
+
+
+def _get_revision():
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+
+def _create_backend(env, server, values=None):
+    fake_odoo = server.fake_odoo
+    host, port = server.httpd.server_address[:2]
+    backend_values = {
+        "name": "Benchmark",
+        "version": "12.0",
+        "protocol": "http",
+        "hostname": host,
+        "port": port,
+        "database": fake_odoo.db,
+        "login": fake_odoo.login,
+        "password": fake_odoo.password,
+        "import_span_sample_rate": 0.0,
+    }
+    backend_values.update(values or {})
+    backend = env["odoo.backend"].create(backend_values)
+    backend.button_check_connection()
+    return backend
+
+
+def _measure(env, server, model_name, backend_values=None, trace_memory=True):
+    """Run the batch import of a binding model and return its metrics"""
+    cr = env.cr
+    fake_odoo = server.fake_odoo
+    result = {"model": model_name, "error": False}
+    backend = _create_backend(env, server, backend_values)
+    backend = backend.with_context(queue_job__no_delay=True)
+    binding_model = env[model_name].with_context(queue_job__no_delay=True)
+    with fake_odoo.lock:
+        fake_odoo.stats.clear()
+    queries = cr.sql_log_count
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        binding_model.import_batch(backend, domain=[], force=False)
+    except Exception as exc:
+        _logger.exception("Benchmark of %s failed", model_name)
+        result["error"] = str(exc)
+    duration = time.perf_counter() - start
+    if trace_memory:
+        result["peak_memory_kb"] = tracemalloc.get_traced_memory()[1] // 1024
+        tracemalloc.stop()
+    env.flush_all()
+    with fake_odoo.lock:
+        rpc_calls = sum(fake_odoo.stats.values())
+    records = binding_model.search_count([("backend_id", "=", backend.id)])
+    result.update(
+        {
+            "records": records,
+            "duration": round(duration, 3),
+            "records_per_second": round(records / duration, 2) if duration else 0,
+            "rpc_calls": rpc_calls,
+            "rpc_per_record": round(rpc_calls / records, 3) if records else 0,
+            "sql_queries": cr.sql_log_count - queries,
+            "sql_per_record": (
+                round((cr.sql_log_count - queries) / records, 3) if records else 0
+            ),
+        }
+    )
+    return result
+
+
+def run(
+    env,
+    models=None,
+    sizes=None,
+    output=None,
+    latency=0.0,
+    image_size=0,
+    seed=42,
+    backend_values=None,
+    trace_memory=True,
+):
+    """Benchmark the batch imports of ``models`` for each size of ``sizes``
+
+    :param env: environment of the database to use, nothing is committed
+    :param models: names of the binding models, all of them by default
+    :param sizes: numbers of remote records by model
+    :param output: path of the JSON file the results are written to
+    :param latency: delay of each remote call, in milliseconds
+    :param image_size: size of the remote images, in bytes
+    :param backend_values: values of the benchmark backends, to compare
+                           settings such as ``import_commit_size``
+    :return: the results, as written to ``output``
+    """
+    models = models or BENCHMARK_MODELS
+    results = []
+    for size in sizes or BENCHMARK_SIZES:
+        server = build_server(
+            seed=seed,
+            sizes=_dataset_sizes(size),
+            image_size=image_size,
+            latency=latency,
+        )
+        with server:
+            for model_name in models:
+                env.flush_all()
+                env.cr.execute("SAVEPOINT connector_odoo_benchmark")
+                try:
+                    with mock.patch.object(env.cr, "commit", env.flush_all):
+                        result = _measure(
+                            env,
+                            server,
+                            model_name,
+                            backend_values=backend_values,
+                            trace_memory=trace_memory,
+                        )
+                except Exception as exc:
+                    _logger.exception("Benchmark of %s failed", model_name)
+                    result = {"model": model_name, "error": str(exc)}
+                finally:
+                    env.cr.execute("ROLLBACK TO SAVEPOINT connector_odoo_benchmark")
+                    env.invalidate_all()
+                result["size"] = size
+                _logger.info("Benchmark: %s", result)
+                results.append(result)
+    report = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "revision": _get_revision(),
+            "python": platform.python_version(),
+            "latency": latency,
+            "image_size": image_size,
+            "seed": seed,
+            "backend_values": backend_values or {},
+            "trace_memory": trace_memory,
+        },
+        "results": results,
+    }
+    if output:
+        with open(output, "w") as output_file:
+            json.dump(report, output_file, indent=2, sort_keys=True)
+    return report
+
+
+def compare(baseline, current, tolerance=0.1):
+    """Return the regressions of ``current`` compared to ``baseline``
+
+    :param baseline: results of ``run``, or the path of their JSON file
+    :param current: results of ``run``, or the path of their JSON file
+    :param tolerance: relative change below which a metric is considered
+                      unchanged
+    :return: list of (model, size, metric, baseline value, current value)
+    """
+    reports = []
+    for report in (baseline, current):
+        if isinstance(report, str):
+            with open(report) as report_file:
+                report = json.load(report_file)
+        reports.append({(res["model"], res["size"]): res for res in report["results"]})
+    regressions = []
+    for key, old in sorted(reports[0].items()):
+        new = reports[1].get(key)
+        if not new or old.get("error") or new.get("error"):
+            continue
+        for metric, higher_is_better in METRICS.items():
+            old_value, new_value = old.get(metric), new.get(metric)
+            if not old_value or new_value is None:
+                continue
+            change = (new_value - old_value) / old_value
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(key + (metric, old_value, new_value))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two benchmark results")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compare_parser = subparsers.add_parser("compare")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--tolerance", type=float, default=0.1)
+    args = parser.parse_args(argv)
+    regressions = compare(args.baseline, args.current, tolerance=args.tolerance)
+    for model_name, size, metric, old_value, new_value in regressions:
+        print(
+            "{} ({} records) {}: {} -> {}".format(
+                model_name, size, metric, old_value, new_value
+            )
+        )
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,5 +4,7 @@ from . import core
 from . import backend_adapter
 from . import binder
 from . import importer
+from . import planner
+from . import reconciler
 from . import mapper
 from . import exporter
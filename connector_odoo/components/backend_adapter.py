@@ -67,6 +67,23 @@ class GenericAdapter(AbstractComponent):
     # _odoo_model = None
     # _admin_path = None
 
+    # Remote fields read by the importers. When None, they are derived
+    # from the mapper and importer declarations.
+    _read_fields = None
+
+    # Number of ids fetched by each request of iter_search
+    _search_page_size = 1000
+
+    # Keep the records read by read() in the remote record cache
+    _cache_reads = True
+
+    def _get_read_fields(self, fields):
+        """Return the fields to read for an import, ``fields`` being the
+        derived ones. Override to force a projection for a model."""
+        if self._read_fields is not None:
+            return list(self._read_fields)
+        return fields
+
     def search(
         self,
         domain=None,
@@ -106,9 +123,44 @@ class GenericAdapter(AbstractComponent):
             )
         ]
 
+    def iter_search(self, domain=None, model=None, page_size=None):
+        """Search records according to some criterias and yield their ids.
+
+        Records are fetched by pages ordered by id, each page starting
+        after the last id of the previous one, so every request stays
+        bounded whatever the number of matching records.
+        """
+        page_size = page_size or self._search_page_size
+        last_id = 0
+        while True:
+            page = self.search(
+                domain=list(domain or []) + [("id", ">", last_id)],
+                model=model,
+                limit=page_size,
+                order="id",
+            )
+            yield from page
+            if len(page) < page_size:
+                return
+            last_id = page[-1]
+
+    def _get_record_cache(self):
+        """Return the remote record cache, or None when it is disabled"""
+        if not (self._cache_reads and self.backend_record.remote_cache_ttl):
+            return None
+        return self.env["odoo.remote.record.cache"].sudo()
+
     # pylint: disable=W8106,W0622
-    def read(self, res_id, model=None, context=None):
+    def read(self, res_id, model=None, context=None, fields=None, write_date=None):
         """Returns the information of a record
+
+        The records are kept in the remote record cache, a cached record
+        being used only when its remote write date didn't change.
+
+        :param write_date: remote write date of the record, when it is
+                           already known. Otherwise it is probed with a
+                           read of the write date only, when the record
+                           is in the cache.
         :rtype: dict
         """
         ext_model = model or self._odoo_model
@@ -121,11 +173,68 @@ class GenericAdapter(AbstractComponent):
                 "Backend Adapter."
             )
 
-        return odoo_api.browse(
+        cache = self._get_record_cache()
+        if cache is None or context or fields == ["write_date"]:
+            return odoo_api.browse(
+                model=ext_model,
+                res_id=res_id,
+                fields=fields,
+                context=context,
+                get_passive=self._get_passive,
+            )
+        fields_key = ",".join(sorted(fields)) if fields else "*"
+        cached = cache._get_cached(self.backend_record, ext_model, res_id, fields_key)
+        if cached is not None:
+            # The write date is only probed when there is a cached record
+            if not write_date:
+                write_date = odoo_api.browse(
+                    model=ext_model,
+                    res_id=res_id,
+                    fields=["write_date"],
+                    get_passive=self._get_passive,
+                ).get("write_date")
+            if write_date and cached[0] == write_date:
+                return cached[1]
+        record = odoo_api.browse(
             model=ext_model,
             res_id=res_id,
+            fields=fields,
+            get_passive=self._get_passive,
+        )
+        if record.get("write_date"):
+            cache._set_payload(
+                self.backend_record,
+                ext_model,
+                res_id,
+                fields_key,
+                record["write_date"],
+                record,
+            )
+        return record
+
+    def read_many(
+        self, res_ids, model=None, fields=None, context=None, chunk_size=None
+    ):
+        """Returns the information of several records, by chunks of ids
+        :rtype: dict
+        """
+        ext_model = model or self._odoo_model
+        try:
+            odoo_api = self.work.odoo_api
+        except AttributeError:
+            raise AttributeError(
+                "You must provide a odoo_api attribute with a "
+                "OdooAPI instance to be able to use the "
+                "Backend Adapter."
+            )
+        kwargs = {"chunk_size": chunk_size} if chunk_size else {}
+        return odoo_api.read_many(
+            model=ext_model,
+            res_ids=res_ids,
+            fields=fields,
             context=context,
             get_passive=self._get_passive,
+            **kwargs,
         )
 
     def create(self, data):
@@ -2,8 +2,9 @@
 # © 2016 Sodexis
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
 
+from odoo import fields
+
 from odoo.addons.component.core import Component
-from odoo import tools
 
 
 class OdooModelBinder(Component):
@@ -19,6 +20,53 @@ class OdooModelBinder(Component):
     _name = "odoo.binder"
     _inherit = ["base.binder", "base.odoo.connector"]
 
+    def _get_default_backend_id(self):
+        cache = getattr(self.work, "binder_cache", {})
+        if "default_backend_id" not in cache:
+            cache["default_backend_id"] = self.env.company.default_odoo_backend_id.id
+        return cache["default_backend_id"]
+
+    def _get_binding_ids(self, external_ids):
+        """Return the binding ids of each external ID.
+
+        The result is cached in the work context, the external IDs
+        missing from the cache are searched with a single query. As the
+        search of ``to_internal`` did, the query applies the record rules
+        and includes the archived bindings.
+        """
+        cache = getattr(self.work, "binder_cache", {})
+        result = {}
+        missing_ids = set()
+        for external_id in external_ids:
+            key = (self.model._name, int(external_id))
+            if key in cache:
+                result[external_id] = cache[key]
+            else:
+                missing_ids.add(int(external_id))
+        if missing_ids:
+            query = self.model.with_context(active_test=False)._search(
+                [
+                    (self._external_field, "in", list(missing_ids)),
+                    (self._backend_field, "=", self._get_default_backend_id()),
+                ],
+                order="id",
+            )
+            self.env.cr.execute(
+                *query.select(
+                    '"{}"."{}"'.format(self.model._table, self._external_field),
+                    '"{}".id'.format(self.model._table),
+                )
+            )
+            found = {}
+            for external_id, binding_id in self.env.cr.fetchall():
+                found.setdefault(external_id, []).append(binding_id)
+            for external_id in missing_ids:
+                cache[(self.model._name, external_id)] = found.get(external_id, [])
+            for external_id in external_ids:
+                if external_id not in result:
+                    result[external_id] = cache[(self.model._name, int(external_id))]
+        return result
+
     def to_internal(self, external_id, unwrap=False):
         """
         INHERITED to use default_backend_id instead of backend_id
@@ -34,13 +82,7 @@ class OdooModelBinder(Component):
         :rtype: recordset
         """
         context = self.env.context
-        default_backend_id = self.env.company.default_odoo_backend_id
-        bindings = self.model.with_context(active_test=False).search(
-            [
-                (self._external_field, "=", tools.ustr(external_id)),
-                (self._backend_field, "=", default_backend_id.id),
-            ]
-        )
+        bindings = self.model.browse(self._get_binding_ids([external_id])[external_id])
         if not bindings:
             if unwrap:
                 return self.model.browse()[self._odoo_field]
@@ -51,6 +93,56 @@ class OdooModelBinder(Component):
         bindings = bindings.with_context(**context)
         return bindings
 
+    def to_internal_many(self, external_ids, unwrap=False):
+        """
+        Give the Odoo recordset for a list of external IDs, with a single
+        query for the ones which are not cached yet.
+
+        :param external_ids: external IDs for which we want the Odoo IDs
+        :param unwrap: if True, returns the normal records
+                       else return the binding records
+        :return: a recordset in the order of the external IDs, the ones
+                 which are not mapped are left out
+        :rtype: recordset
+        """
+        binding_ids = self._get_binding_ids(external_ids)
+        bindings = self.model.browse(
+            [
+                binding_id
+                for external_id in external_ids
+                for binding_id in binding_ids[external_id]
+            ]
+        )
+        if unwrap:
+            bindings = bindings.mapped(self._odoo_field)
+        return bindings
+
+    def bind(self, external_id, binding):
+        """INHERITED to invalidate the cached binding of the external ID"""
+        res = super(OdooModelBinder, self).bind(external_id, binding)
+        cache = getattr(self.work, "binder_cache", {})
+        cache.pop((self.model._name, int(external_id)), None)
+        return res
+
+    def bind_many(self, bindings_by_external_id):
+        """Bind several records with a single write when they are already
+        linked to their external ID, only the sync date is then updated.
+
+        :param bindings_by_external_id: dict of external ID: binding
+        """
+        cache = getattr(self.work, "binder_cache", {})
+        bound = self.model.browse()
+        for external_id, binding in bindings_by_external_id.items():
+            cache.pop((self.model._name, int(external_id)), None)
+            if binding[self._external_field] == int(external_id):
+                bound |= binding
+            else:
+                self.bind(external_id, binding)
+        if bound:
+            bound.with_context(connector_no_export=True).write(
+                {self._sync_date_field: fields.Datetime.now()}
+            )
+
     def wrap_binding(self, regular, browse=False):
         """For a normal record, gives the binding record.
 
@@ -69,7 +69,7 @@ class OdooBaseExporter(AbstractComponent):
         sync = self.binding.sync_date
         if not sync:
             return True
-        record = self.backend_adapter.read(self.external_id)
+        record = self.backend_adapter.read(self.external_id, fields=["write_date"])
         if not record.get("write_date"):
             # in rare case it can be empty, in doubt, import it
             return True
@@ -126,6 +126,31 @@ class BatchExporter(AbstractComponent):
         for record_id in record_ids:
             self._export_record(record_id)
 
+    def _get_batch_domain(self, domain):
+        """Return the domain of the bindings to export. Override it to
+        add the filters of a model, so both ``run`` and ``run_slice``
+        apply them."""
+        return list(domain or []) + [("backend_id", "=", self.backend_record.id)]
+
+    def _prepare_bindings(self, domain):
+        """Hook called before the first slice of a batch, to create the
+        missing bindings of the records to export"""
+
+    def run_slice(self, domain=None, last_id=0, limit=None, force=False):
+        """Export the next slice of a batch: at most ``limit`` bindings
+        with an id greater than ``last_id``, used by the job spawner.
+        Returns the ids of the slice, in ascending order."""
+        if not last_id:
+            self._prepare_bindings(domain)
+        bindings = self.model.search(
+            self._get_batch_domain(domain) + [("id", ">", last_id)],
+            limit=limit,
+            order="id",
+        )
+        for binding in bindings:
+            self._export_record(binding)
+        return bindings.ids
+
 
 class DelayedBatchExporter(AbstractComponent):
     """Delay import of the records"""
@@ -133,12 +158,17 @@ class DelayedBatchExporter(AbstractComponent):
     _name = "odoo.delayed.batch.exporter"
     _inherit = "odoo.batch.exporter"
 
+    def _get_job_options(self, binding):
+        """Return the options of the job exporting ``binding``"""
+        return {
+            "channel": self.model._get_channel_name(self.backend_record),
+            "priority": self.model._priority,
+        }
+
     def _export_record(self, external_id, job_options=None, **kwargs):
         """Delay the import of the records"""
         delayable = external_id.with_delay(
-            channel=self.model._unique_channel_name,
-            priority=self.model._priority,
-            **job_options or {},
+            **dict(self._get_job_options(external_id), **job_options or {})
         )
         delayable.export_record(self.backend_record, **kwargs)
 
@@ -14,15 +14,21 @@ are already bound, to update the last sync date.
 
 """
 
+import base64
+import hashlib
+import json
 import logging
+import time
+from contextlib import contextmanager
+from itertools import islice
 
 from odoo import _, fields
 from odoo.tools import frozendict
 
-from odoo.addons.component.core import AbstractComponent
+from odoo.addons.component.core import AbstractComponent, Component
 from odoo.addons.connector.exception import IDMissingInBackend, RetryableJobError
 from odoo.addons.queue_job.exception import NothingToDoJob
-from psycopg2.extras import Json
+from psycopg2.extras import Json, execute_values
 
 _logger = logging.getLogger(__name__)
 
@@ -34,11 +40,28 @@ class OdooImporter(AbstractComponent):
     _inherit = ["base.importer", "base.odoo.connector"]
     _usage = "record.importer"
 
+    # Remote fields read by the importer hooks, in addition to the ones
+    # declared by the mapper.
+    _extra_read_fields = []
+    # Remote fields left out of the payload hash, they change without
+    # any change of the data.
+    _hash_exclude_fields = ["write_date", "__last_update"]
+    # Remote relational fields of the records which must be imported
+    # before the record, with their binding model. Used by the import
+    # planner of the chunk imports.
+    _dependency_fields = {}
+    # Import the chunks with the bulk importer, for simple models without
+    # records specific create or write.
+    _import_bulk = False
+
     def __init__(self, work_context):
         super(OdooImporter, self).__init__(work_context)
         self.external_id = None
         self.odoo_record = None
         self.job_uuid = None
+        self.sync_hash = None
+        self.remote_write_date = None
+        self.is_dependency = False
 
     def _connect_with_job(self, context_dict):
         """Save job_uuid in context to match write external odoo id to the job"""
@@ -46,9 +69,56 @@ class OdooImporter(AbstractComponent):
             self.job_uuid = job_uuid
         return True
 
+    @contextmanager
+    def _span(self, phase):
+        """Time a phase of the import, when the job samples its spans"""
+        spans = getattr(self.work, "import_spans", None)
+        if spans is None:
+            yield
+            return
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            spans.append(
+                {
+                    "model_name": self.work.model_name,
+                    "external_id": self.external_id,
+                    "phase": phase,
+                    "duration": (time.monotonic() - start) * 1000.0,
+                }
+            )
+
+    def _get_read_fields(self):
+        """Return the remote fields to read, or None to read all of them"""
+        fields = self.mapper._get_remote_fields()
+        if fields is not None:
+            fields = sorted(
+                fields.union(
+                    ["id", "write_date"],
+                    self._extra_read_fields,
+                    self._dependency_fields,
+                )
+            )
+        return self.backend_adapter._get_read_fields(fields)
+
     def _get_odoo_data(self):
         """Return the raw Odoo data for ``self.external_id``"""
-        data = self.backend_adapter.read(self.external_id)
+        # Records already read by a chunk import
+        prefetched = getattr(self.work, "prefetched_records", None)
+        key = (self.work.model_name, self.external_id)
+        if prefetched and key in prefetched:
+            data = prefetched.pop(key)
+            if data is None:
+                raise IDMissingInBackend(
+                    "ID {} not found in backend".format(self.external_id)
+                )
+            return data
+        data = self.backend_adapter.read(
+            self.external_id,
+            fields=self._get_read_fields(),
+            write_date=self.remote_write_date,
+        )
         return data
 
     def _before_import(self):
@@ -59,7 +129,11 @@ class OdooImporter(AbstractComponent):
         """Return True if the import should be skipped because
         it is already up-to-date in Odoo"""
         assert self.odoo_record
-        odoo_date = self.odoo_record.get("write_date", False)
+        return self._is_date_uptodate(binding, self.odoo_record.get("write_date"))
+
+    def _is_date_uptodate(self, binding, odoo_date):
+        """Return True if the binding has been synchronized after the
+        remote ``odoo_date``"""
         if not odoo_date:
             return  # no update date on Odoo, always import it.
         if not binding:
@@ -77,6 +151,95 @@ class OdooImporter(AbstractComponent):
         # miss changes done in Odoo
         return from_string(odoo_date) < sync_date
 
+    def _get_remote_write_date(self):
+        """Return the remote write date of ``self.external_id``, from the
+        dates prefetched in the work context or with a light read"""
+        probes = getattr(self.work, "write_date_probes", {})
+        key = (self.work.model_name, self.external_id)
+        if key in probes:
+            self.remote_write_date = probes.pop(key)
+            return self.remote_write_date
+        try:
+            data = self.backend_adapter.read(self.external_id, fields=["write_date"])
+        except IDMissingInBackend:
+            return None
+        self.remote_write_date = data.get("write_date")
+        return self.remote_write_date
+
+    def _is_probe_uptodate(self, binding):
+        """Check the remote write date before reading the whole record.
+
+        Only the dependencies and the records whose write date has been
+        prefetched are probed: the other records come from a search of
+        the modified records, the probe would only add a request.
+        """
+        if not (binding and binding.sync_date):
+            return False
+        key = (self.work.model_name, self.external_id)
+        prefetched = getattr(self.work, "prefetched_records", None)
+        if prefetched and key in prefetched:
+            return False
+        probes = getattr(self.work, "write_date_probes", {})
+        if not (self.is_dependency or key in probes):
+            return False
+        return self._is_date_uptodate(binding, self._get_remote_write_date())
+
+    def _prefetch_write_dates(self, binding_model, external_ids):
+        """Read with a single call the remote write dates of the bound
+        records among ``external_ids``, for the probes of their imports"""
+        probes = getattr(self.work, "write_date_probes", None)
+        if probes is None:
+            return
+        external_ids = [
+            external_id
+            for external_id in set(external_ids)
+            if external_id and (binding_model, external_id) not in probes
+        ]
+        bindings = self.binder_for(binding_model).to_internal_many(external_ids)
+        bound_ids = bindings.filtered("sync_date").mapped("external_id")
+        if not bound_ids:
+            return
+        adapter = self.component(usage="backend.adapter", model_name=binding_model)
+        records = adapter.read_many(bound_ids, fields=["write_date"])
+        for external_id in bound_ids:
+            record = records.get(external_id)
+            probes[(binding_model, external_id)] = record and record.get("write_date")
+
+    def _get_natural_key(self):
+        """Return the key of ``self.odoo_record`` used by the ``only_create``
+        mappings to find an existing local record, or None. The bulk
+        import creates a single record per key and chunk."""
+        return None
+
+    def _get_sync_hash(self):
+        """Return the fingerprint of the remote data"""
+        payload = {
+            key: value
+            for key, value in self.odoo_record.items()
+            if key not in self._hash_exclude_fields
+        }
+        payload = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    def _is_unchanged(self, binding):
+        """Return True if the remote data did not change since the
+        last import of the binding"""
+        return bool(binding and binding.sync_hash == self.sync_hash)
+
+    def _get_dependencies(self, record):
+        """Return the (binding model, external id) of the records which
+        ``record`` depends on, from ``_dependency_fields``"""
+        dependencies = []
+        for field_name, binding_model in self._dependency_fields.items():
+            value = record.get(field_name)
+            if not value:
+                continue
+            if len(value) == 2 and isinstance(value[1], str):
+                # many2one: [id, display_name]
+                value = value[:1]
+            dependencies.extend((binding_model, res_id) for res_id in value)
+        return dependencies
+
     def _import_dependency(
         self, external_id, binding_model, importer=None, force=False
     ):
@@ -100,6 +263,13 @@ class OdooImporter(AbstractComponent):
         """
         if not external_id:
             return
+        # Each dependency is imported only once per job
+        imported = getattr(self.work, "imported_dependencies", None)
+        if imported is not None:
+            key = (binding_model, int(external_id))
+            if key in imported:
+                return
+            imported.add(key)
         binder = self.binder_for(binding_model)
         binding = binder.to_internal(external_id)
         if force or not (binding and self._is_uptodate(binding)):
@@ -107,6 +277,7 @@ class OdooImporter(AbstractComponent):
                 importer = self.component(
                     usage="record.importer", model_name=binding_model
                 )
+            importer.is_dependency = True
             try:
                 importer.run(external_id, force=force)
             except NothingToDoJob:
@@ -199,13 +370,91 @@ class OdooImporter(AbstractComponent):
     def _update_data(self, map_record, **kwargs):
         return map_record.values(**kwargs)
 
+    def _get_field_owner(self, record, field):
+        """Return the record and the field which really store ``field``,
+        following the ``_inherits`` of the binding"""
+        while field.inherited:
+            parent_field = record._inherits[field.related_field.model_name]
+            record = record[parent_field]
+            field = field.related_field
+        return record, field
+
+    def _is_binary_unchanged(self, record, field, value):
+        """Compare a binary value with the stored one, by checksum for
+        the fields stored as attachments"""
+        record, field = self._get_field_owner(record, field)
+        if isinstance(value, str):
+            value = value.encode()
+        if not field.attachment:
+            current = record.with_context(bin_size=False)[field.name]
+            return (current or False) == (value or False)
+        attachment = (
+            self.env["ir.attachment"]
+            .sudo()
+            .search(
+                [
+                    ("res_model", "=", record._name),
+                    ("res_field", "=", field.name),
+                    ("res_id", "=", record.id),
+                ],
+                limit=1,
+            )
+        )
+        if not value:
+            return not attachment
+        checksum = attachment._compute_checksum(base64.b64decode(value))
+        return attachment.checksum == checksum
+
+    def _is_value_unchanged(self, record, field, value):
+        """Return True if writing ``value`` would not change ``field``"""
+        if field.type == "binary":
+            return self._is_binary_unchanged(record, field, value)
+        if field.type in ("one2many", "many2many"):
+            commands = value if isinstance(value, (list, tuple)) else []
+            if any(
+                isinstance(command, (list, tuple)) and command[0] in (0, 1)
+                for command in commands
+            ):
+                # Created or updated lines can not be compared
+                return False
+        new_value = field.convert_to_record(
+            field.convert_to_cache(value, record), record
+        )
+        return new_value == record[field.name]
+
+    def _get_changed_values(self, binding, data):
+        """Return the part of ``data`` which differs from the values
+        of the binding. The values which can not be compared are kept."""
+        changed = {}
+        for field_name, value in data.items():
+            field = binding._fields.get(field_name)
+            if not field or not field.store and not field.inherited:
+                changed[field_name] = value
+                continue
+            try:
+                if self._is_value_unchanged(binding, field, value):
+                    continue
+            except Exception as e:
+                _logger.debug(
+                    "Could not compare the field %s of %s: %s", field_name, binding, e
+                )
+            changed[field_name] = value
+        return changed
+
     def _update(self, binding, data):
         """Update an Odoo record"""
         context = {**{"connector_no_export": True}, **self._get_context()}
         # Todo yigit: we've added sudo here. maybe we should avoid sudo and
         # rearrange the permissions
-        binding.with_context(context).sudo().write(data)
-        _logger.info("%d updated from Odoo %s", binding, self.external_id)
+        binding = binding.with_context(context).sudo()
+        data = self._get_changed_values(binding, data)
+        if not data:
+            _logger.info("%d unchanged from Odoo %s", binding, self.external_id)
+            return
+        binding.write(data)
+        _logger.info(
+            "%d updated from Odoo %s: %s", binding, self.external_id, sorted(data)
+        )
         return
 
     def _translate_fields(self, binding):
@@ -254,6 +503,9 @@ class OdooImporter(AbstractComponent):
         context = {**{"connector_no_export": True}, **self._get_context()}
         self.env.context = frozendict(self.env.context, **context)
         self.env.flush_all()
+        if getattr(self.work, "defer_commit", False):
+            # Chunk imports commit once for the whole chunk
+            return True
         self.env.cr.commit()
         return True
 
@@ -311,6 +563,9 @@ class OdooImporter(AbstractComponent):
         """
         force = self._check_force_available(force=force)
         self.external_id = external_id
+        imported = getattr(self.work, "imported_dependencies", None)
+        if imported is not None:
+            imported.add((self.work.model_name, int(external_id)))
         binding = self._get_binding()
         must_continue = self._init_import(binding, external_id)
         if not must_continue:
@@ -321,8 +576,13 @@ class OdooImporter(AbstractComponent):
             )
             return _("This record must not be imported.")
 
+        if not force and self._is_probe_uptodate(binding):
+            _logger.info("Already up-to-date")
+            return _("Already up-to-date.")
+
         try:
-            self.odoo_record = self._get_odoo_data()
+            with self._span("read"):
+                self.odoo_record = self._get_odoo_data()
         except (IDMissingInBackend, ValueError):
             return _("Record does no longer exist in Odoo")
 
@@ -337,6 +597,17 @@ class OdooImporter(AbstractComponent):
             _logger.info("Already up-to-date")
             return _("Already up-to-date.")
 
+        self.sync_hash = self._get_sync_hash()
+        if not force and self._is_unchanged(binding):
+            _logger.info(
+                "({}: {}) Remote data did not change".format(
+                    self.work.model_name, external_id
+                )
+            )
+            self.binder.bind(self.external_id, binding)
+            self._commit()
+            return _("Already up-to-date.")
+
         # self._link_queue_job(binding)
 
         self._before_import()
@@ -345,17 +616,22 @@ class OdooImporter(AbstractComponent):
         _logger.info(
             "Importing dependencies ({}: {})".format(self.work.model_name, external_id)
         )
-        self._import_dependencies(force=force)
+        with self._span("dependencies"):
+            self._import_dependencies(force=force)
 
         _logger.info("Mapping data ({}: {})".format(self.work.model_name, external_id))
-        map_record = self._map_data()
+        with self._span("mapping"):
+            map_record = self._map_data()
         try:
-            if binding:
-                record = self._update_data(map_record, binding=binding)
-                self._update(binding, record)
-            else:
-                record = self._create_data(map_record)
-                binding = self._create(record)
+            with self._span("write"):
+                if binding:
+                    record = self._update_data(map_record, binding=binding)
+                    record["sync_hash"] = self.sync_hash
+                    self._update(binding, record)
+                else:
+                    record = self._create_data(map_record)
+                    record["sync_hash"] = self.sync_hash
+                    binding = self._create(record)
         except Exception as e:
             _logger.error(
                 "An error occurred while connecting the record {}: {}".format(
@@ -372,10 +648,12 @@ class OdooImporter(AbstractComponent):
         _logger.info(
             "Translating Fields ({}: {})".format(self.work.model_name, external_id)
         )
-        self._translate_fields(binding)
+        with self._span("translate"):
+            self._translate_fields(binding)
 
         _logger.info("Binding ({}: {})".format(self.work.model_name, external_id))
-        self.binder.bind(self.external_id, binding)
+        with self._span("bind"):
+            self.binder.bind(self.external_id, binding)
 
         _logger.info(
             "Check if after import process must be executed ({}: {})".format(
@@ -383,11 +661,14 @@ class OdooImporter(AbstractComponent):
             )
         )
         # We commit the transaction before the after import
-        self._commit()
-        self._after_import(binding, force)
+        with self._span("commit"):
+            self._commit()
+        with self._span("after_import"):
+            self._after_import(binding, force)
         _logger.info("Finished ({}: {})!".format(self.work.model_name, external_id))
         # We commit the transaction after the after import
-        self._commit()
+        with self._span("commit"):
+            self._commit()
         return _("Imported with success.")
 
 
@@ -414,11 +695,44 @@ class BatchImporter(AbstractComponent):
         self.advisory_lock_or_retry(lock_name)
         _logger.info("Resource {} locked".format(lock_name))
 
+    # Remote model searched for the records to import, the model of the
+    # backend adapter when not set
+    _search_model = None
+
+    def _get_batch_domain(self, domain):
+        """Return the remote domain of the records to import. Override it
+        to add the filters of a model, so both ``run`` and ``run_slice``
+        apply them."""
+        return list(domain or [])
+
     def run(self, domain=None, force=False):
         """Run the synchronization"""
-        record_ids = self.backend_adapter.search(domain)
-        for record_id in record_ids:
-            self._import_record(record_id, force=force)
+        external_ids = self.backend_adapter.iter_search(
+            self._get_batch_domain(domain), model=self._search_model
+        )
+        self._import_records(external_ids, force=force)
+
+    def run_slice(self, domain=None, last_id=0, limit=None, force=False):
+        """Import the next slice of a batch: at most ``limit`` records
+        with an id greater than ``last_id``, used by the job spawner.
+        Returns the external ids of the slice, in ascending order."""
+        external_ids = self.backend_adapter.search(
+            domain=self._get_batch_domain(domain) + [("id", ">", last_id)],
+            model=self._search_model,
+            limit=limit,
+            order="id",
+        )
+        self._import_records(external_ids, force=force)
+        return external_ids
+
+    def _import_records(self, external_ids, force=False):
+        """Import the records of an iterable of external ids, which is
+        consumed lazily. Returns the number of records."""
+        count = 0
+        for external_id in external_ids:
+            self._import_record(external_id, force=force)
+            count += 1
+        return count
 
     def _import_record(self, external_id, force=False):
         """Import a record directly or delay the import of the record.
@@ -428,6 +742,252 @@ class BatchImporter(AbstractComponent):
         raise NotImplementedError
 
 
+class OdooChunkImporter(Component):
+    """Import a chunk of records in a single job.
+
+    The import planner reads the records and their missing dependencies
+    with a few requests and sorts them in levels. The levels are then
+    imported one by one, each record in a savepoint, so a failing record
+    doesn't fail the whole chunk. Failing records are delayed in their
+    own job. The transaction is committed every ``import_commit_size``
+    records or ``import_commit_interval`` milliseconds of the backend.
+    """
+
+    _name = "odoo.chunk.importer"
+    _inherit = ["base.importer", "base.odoo.connector"]
+    _usage = "chunk.importer"
+
+    def _import_record(self, binding_model, external_id, force=False):
+        importer = self.component(usage="record.importer", model_name=binding_model)
+        importer.set_lock(external_id)
+        return importer.run(external_id, force=force)
+
+    def _commit(self):
+        """Group commit of the records imported so far"""
+        self.env.flush_all()
+        self.env.cr.commit()
+
+    def _run_bulk(self, external_ids, force=False):
+        """Import the chunk with the bulk importer, return None when
+        it failed and the records must be imported one by one"""
+        try:
+            with self.env.cr.savepoint():
+                bulk_importer = self.component(usage="bulk.importer")
+                return bulk_importer.run(external_ids, force=force)
+        except Exception as e:
+            self.work.binder_cache.clear()
+            self.work.imported_dependencies.clear()
+            _logger.warning(
+                "Bulk import of %s failed, importing the records one by one: %s",
+                self.work.model_name,
+                e,
+            )
+            return None
+
+    def run(self, external_ids, force=False):
+        """Run the synchronization of the chunk"""
+        if self.component(usage="record.importer")._import_bulk:
+            result = self._run_bulk(external_ids, force=force)
+            if result is not None:
+                return result
+        # Phase 1: fetch the records and their dependencies
+        planner = self.component(usage="import.planner")
+        levels = planner.plan(external_ids, force=force)
+        # Phase 2: apply them level by level against the cursor
+        failed_ids = []
+        commit_size = self.backend_record.import_commit_size
+        commit_interval = self.backend_record.import_commit_interval / 1000.0
+        uncommitted = 0
+        last_commit = time.monotonic()
+        for level in levels:
+            for binding_model, external_id in level:
+                if uncommitted and (
+                    (commit_size and uncommitted >= commit_size)
+                    or (
+                        commit_interval
+                        and time.monotonic() - last_commit >= commit_interval
+                    )
+                ):
+                    self._commit()
+                    uncommitted = 0
+                    last_commit = time.monotonic()
+                uncommitted += 1
+                try:
+                    with self.env.cr.savepoint():
+                        self._import_record(binding_model, external_id, force=force)
+                except Exception as e:
+                    # The cached bindings may have been rolled back
+                    self.work.binder_cache.clear()
+                    self.work.imported_dependencies.clear()
+                    _logger.error(
+                        "Chunk import of %s(%s) failed: %s",
+                        binding_model,
+                        external_id,
+                        e,
+                    )
+                    if binding_model == self.work.model_name:
+                        failed_ids.append(external_id)
+        for external_id in failed_ids:
+            self.model.delayed_import_record(
+                self.backend_record, external_id, force=force
+            )
+        return _("%(imported)s records imported, %(failed)s delayed.") % {
+            "imported": sum(len(level) for level in levels) - len(failed_ids),
+            "failed": len(failed_ids),
+        }
+
+
+class OdooBulkImporter(Component):
+    """Import a chunk of records of a simple model with bulk ORM calls.
+
+    The records are mapped by the record importer of the model, then the
+    new ones are created with a single ``create`` and the existing ones
+    are updated with one ``write`` per set of identical values. Models
+    enable it with the ``_import_bulk`` attribute of their importer.
+    """
+
+    _name = "odoo.bulk.importer"
+    _inherit = ["base.importer", "base.odoo.connector"]
+    _usage = "bulk.importer"
+
+    def _read_records(self, importer, external_ids):
+        prefetched = self.work.prefetched_records
+        missing_ids = [
+            external_id
+            for external_id in external_ids
+            if (self.work.model_name, external_id) not in prefetched
+        ]
+        records = {}
+        if missing_ids:
+            records = self.backend_adapter.read_many(
+                missing_ids, fields=importer._get_read_fields()
+            )
+        for external_id in external_ids:
+            key = (self.work.model_name, external_id)
+            if key in prefetched:
+                records[external_id] = prefetched.pop(key)
+        return records
+
+    def _store_sync_hashes(self, hashes):
+        """Store the payload hashes of the bindings with one query"""
+        if not hashes:
+            return
+        self.model.flush_model(["sync_hash"])
+        execute_values(
+            self.env.cr._obj,
+            'UPDATE "{table}" SET sync_hash = data.sync_hash '
+            "FROM (VALUES %s) AS data(id, sync_hash) "
+            'WHERE "{table}".id = data.id'.format(table=self.model._table),
+            list(hashes.items()),
+        )
+        self.model.invalidate_model(["sync_hash"])
+
+    def run(self, external_ids, force=False):
+        """Import the records of the chunk"""
+        importer = self.component(usage="record.importer")
+        force = importer._check_force_available(force=force)
+        records = self._read_records(importer, external_ids)
+        bindings = self.binder.to_internal_many(external_ids)
+        bindings = {binding.external_id: binding.id for binding in bindings}
+        imported = getattr(self.work, "imported_dependencies", set())
+        context = {**{"connector_no_export": True}, **importer._get_context()}
+        model = self.model.sudo().with_context(context)
+
+        to_create = {}
+        to_write = {}
+        to_update = {}
+        unchanged = {}
+        hashes = {}
+        natural_keys = set()
+        deferred = []
+        # The records go through the hooks of the record importer in the
+        # same order as its run(), up to the writes which are grouped
+        for external_id in external_ids:
+            record = records.get(external_id)
+            if not record:
+                continue
+            importer.set_lock(external_id)
+            imported.add((self.work.model_name, external_id))
+            importer.external_id = external_id
+            importer.odoo_record = None
+            binding = model.browse(bindings.get(external_id, []))
+            if not importer._init_import(binding, external_id):
+                continue
+            importer.odoo_record = record
+            binding = importer._get_binding_with_data(binding)
+            if importer._must_skip():
+                continue
+            if not force and importer._is_uptodate(binding):
+                continue
+            importer.sync_hash = importer._get_sync_hash()
+            if not force and importer._is_unchanged(binding):
+                unchanged[external_id] = binding
+                continue
+            if not binding:
+                natural_key = importer._get_natural_key()
+                if natural_key is not None:
+                    if natural_key in natural_keys:
+                        # Imported once the first record of the key exists,
+                        # so the lookup of the mapper finds it
+                        deferred.append(external_id)
+                        continue
+                    natural_keys.add(natural_key)
+            importer._before_import()
+            importer._import_dependencies(force=force)
+            map_record = importer._map_data()
+            if binding:
+                vals = importer._update_data(map_record, binding=binding)
+                vals = importer._get_changed_values(binding, vals)
+                if vals:
+                    key = repr(sorted(vals.items()))
+                    to_write.setdefault(key, (vals, []))[1].append(binding.id)
+                hashes[binding.id] = importer.sync_hash
+                to_update[external_id] = binding
+            else:
+                vals = importer._create_data(map_record)
+                vals.update(
+                    {
+                        "sync_hash": importer.sync_hash,
+                        self.binder._external_field: external_id,
+                        self.binder._sync_date_field: fields.Datetime.now(),
+                    }
+                )
+                to_create[external_id] = vals
+
+        for vals, binding_ids in to_write.values():
+            model.browse(binding_ids).write(vals)
+        created = model.create(list(to_create.values()))
+        # to_internal_many cached the new external IDs as not bound
+        cache = getattr(self.work, "binder_cache", {})
+        for external_id in to_create:
+            cache.pop((self.model._name, int(external_id)), None)
+        _logger.info(
+            "%s %s created, %s updated, %s unchanged from Odoo",
+            len(created),
+            self.work.model_name,
+            len(to_update),
+            len(unchanged),
+        )
+        self._store_sync_hashes(hashes)
+        self.binder.bind_many({**unchanged, **to_update})
+        to_update.update(zip(to_create, created))
+
+        for external_id, binding in to_update.items():
+            importer.external_id = external_id
+            importer.odoo_record = records[external_id]
+            importer._translate_fields(binding)
+            importer._after_import(binding, force)
+        for external_id in deferred:
+            self.work.prefetched_records[(self.work.model_name, external_id)] = records[
+                external_id
+            ]
+            self.component(usage="record.importer").run(external_id, force=force)
+        importer._commit()
+        return _("%(imported)s records imported in bulk.") % {
+            "imported": len(to_update) + len(deferred),
+        }
+
+
 class DirectBatchImporter(AbstractComponent):
     """Import the records directly, without delaying the jobs."""
 
@@ -445,12 +1005,37 @@ class DelayedBatchImporter(AbstractComponent):
     _name = "odoo.delayed.batch.importer"
     _inherit = "odoo.batch.importer"
 
+    def _get_job_options(self):
+        """Return the options of the jobs delayed by the batch"""
+        return {
+            "channel": self.model._get_channel_name(self.backend_record),
+            "priority": self.model._priority,
+            "max_retries": 10,
+        }
+
     def _import_record(self, external_id, job_options=None, **kwargs):
         """Delay the import of the records"""
         delayable = self.model.with_delay(
-            channel=self.model._unique_channel_name,
-            priority=self.model._priority,
-            max_retries=10,
-            **job_options or {},
+            **dict(self._get_job_options(), **job_options or {})
         )
         delayable.import_record(self.backend_record, external_id, **kwargs)
+
+    def _import_records(self, external_ids, force=False):
+        """Delay one job per chunk of records when the binding model
+        defines a chunk size"""
+        chunk_size = self.model._chunk_size
+        if not chunk_size:
+            return super()._import_records(external_ids, force=force)
+        count = 0
+        external_ids = iter(external_ids)
+        while chunk := list(islice(external_ids, chunk_size)):
+            self._import_chunk(chunk, force=force)
+            count += len(chunk)
+        return count
+
+    def _import_chunk(self, external_ids, job_options=None, **kwargs):
+        """Delay the import of a chunk of records"""
+        delayable = self.model.with_delay(
+            **dict(self._get_job_options(), **job_options or {})
+        )
+        delayable.import_records(self.backend_record, external_ids, **kwargs)
@@ -22,11 +22,60 @@ def field_by_lang(field):
     return modifier
 
 
+def image_field_name(mapper):
+    """Name of the main image field of the remote products"""
+    if mapper.backend_record.version in (
+        "6.1",
+        "7.0",
+        "8.0",
+        "9.0",
+        "10.0",
+        "11.0",
+        "12.0",
+    ):
+        return "image_main"
+    return "image_1920"
+
+
+def remote_fields(*field_names):
+    """Declare the remote fields read by a ``@mapping`` method.
+
+    The importers only read the declared fields from the backend. Items can
+    also be callables receiving the mapper and returning a field name, for
+    fields depending on the backend version.
+
+    A mapper having a mapping method without declaration reads all the
+    fields of the remote record.
+    """
+
+    def decorator(func):
+        func.remote_fields = field_names
+        return func
+
+    return decorator
+
+
 class OdooImportMapper(AbstractComponent):
     _name = "odoo.import.mapper"
     _inherit = ["base.odoo.connector", "base.import.mapper"]
     _usage = "import.mapper"
 
+    def _get_remote_fields(self):
+        """Return the set of remote fields read by the mapper or None when
+        a mapping method does not declare them"""
+        fields = set()
+        for from_attr, __ in getattr(self, "direct", None) or []:
+            fields.add(self._direct_source_field_name(from_attr))
+        for method_name in self._map_methods:
+            method = getattr(type(self), method_name)
+            declared = getattr(method, "remote_fields", None)
+            if declared is None:
+                return None
+            for field_name in declared:
+                fields.add(field_name(self) if callable(field_name) else field_name)
+        return fields
+
+    @remote_fields("id")
     @mapping
     def odoo_id(self, record):
         """Value is assigned to odoo_id so as not to duplicate records already imported"""
@@ -41,6 +90,7 @@ class OdooImportMapper(AbstractComponent):
 
         return {"odoo_id": res_id.id if res_id else None}
 
+    @remote_fields()
     @mapping
     def backend_id(self, record):
         return {"backend_id": self.backend_record.id}
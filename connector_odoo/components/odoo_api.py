@@ -1,14 +1,88 @@
 # Copyright 2023 Yiğit Budak (https://github.com/yibudak)
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
 from odoo.addons.connector.exception import IDMissingInBackend, RetryableJobError
+from hashlib import md5
+from concurrent.futures import ThreadPoolExecutor
 from random import randint
+from requests.adapters import HTTPAdapter
 import requests
+import copy
+import json
 import logging
+import threading
 import time
 
 
 _logger = logging.getLogger(__name__)
 
+# Maximum number of keep-alive connections kept open to the same host by one
+# client. Requests beyond this limit wait for a free connection.
+POOL_MAXSIZE = 10
+
+# Number of ids read with one request by read_many
+READ_CHUNK_SIZE = 200
+
+# Number of threads of read_many_parallel
+FETCH_WORKERS = 4
+
+# Seconds during which the reference tables read by get_reference_records
+# are kept by a client before being read again
+REFERENCE_TTL = 3600
+
+# Fields read for the reference tables
+REFERENCE_FIELDS = {
+    "res.country": ["id", "name", "code"],
+    "res.country.state": ["id", "name", "code", "country_id"],
+    "product.price.type": ["id", "name", "currency"],
+    "account.account.type": ["id", "name", "type"],
+}
+
+
+_rpc_stats_local = threading.local()
+
+
+class RPCStats(object):
+    """
+    Collector of the remote calls made by the current thread.
+
+    Use it as a context manager around a job, every call posted by an
+    OdooAPI client is then counted by model and method with its request
+    and response sizes and its duration.
+    """
+
+    def __init__(self):
+        self.calls = {}
+        self._lock = threading.Lock()
+        self._previous = None
+
+    def __enter__(self):
+        self._previous = current_rpc_stats()
+        _rpc_stats_local.stats = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _rpc_stats_local.stats = self._previous
+
+    def add(self, model, method, request_bytes, response_bytes, duration):
+        key = "{}.{}".format(model, method) if model else method
+        with self._lock:
+            stats = self.calls.setdefault(
+                key,
+                {"count": 0, "request_bytes": 0, "response_bytes": 0, "duration": 0.0},
+            )
+            stats["count"] += 1
+            stats["request_bytes"] += request_bytes
+            stats["response_bytes"] += response_bytes
+            stats["duration"] += duration
+
+    def total(self, name):
+        return sum(stats[name] for stats in self.calls.values())
+
+
+def current_rpc_stats():
+    """Return the RPCStats collecting the calls of the current thread"""
+    return getattr(_rpc_stats_local, "stats", None)
+
 
 class OdooAPI(object):
     """
@@ -25,15 +99,19 @@ class OdooAPI(object):
         uid=0,
         default_lang="tr_TR",
         translation_langs=None,
+        pool_maxsize=POOL_MAXSIZE,
     ):
         self.base_url = base_url
         self.db = db
         self.login = login
         self.password = password
         self.timeout = timeout
-        self._default_lang = default_lang
-        self._translation_langs = translation_langs
-        self._session = requests.Session()
+        self._context = {"lang": default_lang}
+        if translation_langs:
+            self._context["translation_lang_codes"] = translation_langs
+        self._session = self._build_session(pool_maxsize)
+        self._reference_cache = {}
+        self._reference_lock = threading.Lock()
         self._uid = self._get_uid() if uid == 0 else uid
         if not self._uid:
             _logger.error("OdooAPI: Authentication failed. Username: %s", self.login)
@@ -41,17 +119,56 @@ class OdooAPI(object):
     def __repr__(self):
         return "<OdooAPI {}>".format(self.base_url)
 
+    def with_context(self, **context):
+        """Return a client sending ``context`` with each call. It shares
+        the session, the login and the caches of this one, so the language
+        of the calls does not change the pooled client."""
+        client = copy.copy(self)
+        client._context = dict(self._context, **context)
+        return client
+
+    def _build_session(self, pool_maxsize):
+        """Session keeping keep-alive sockets to the backend, so the TCP/TLS
+        handshake is only paid once per connection of the pool."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            pool_block=True,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
     @property
     def query_id(self):
         return randint(1, 99999)
 
+    def _record_stats(self, payload, request_bytes, response_bytes, duration):
+        stats = current_rpc_stats()
+        if stats is None:
+            return
+        params = payload.get("params", {})
+        args = params.get("args") or []
+        if params.get("service") == "object" and len(args) > 4:
+            model, method = args[3], args[4]
+        else:
+            model, method = False, params.get("method")
+        stats.add(model, method, request_bytes, response_bytes, duration)
+
     def _post(self, payload):
         try:
+            data = json.dumps(payload)
+            start = time.monotonic()
             response = self._session.post(
                 self.base_url + "/jsonrpc",
-                json=payload,
+                data=data,
+                headers={"Content-Type": "application/json"},
                 timeout=self.timeout,
             )
+            self._record_stats(
+                payload, len(data), len(response.content), time.monotonic() - start
+            )
             response.raise_for_status()
             json_resp = response.json()
             if json_resp.get("error"):
@@ -74,15 +191,9 @@ class OdooAPI(object):
         }
 
     def _build_context(self, context=None):
-        _ctx = {
-            "lang": self._default_lang,
-            "connector_request": True,
-        }
+        _ctx = dict(self._context, connector_request=True)
         if context:
             _ctx.update(context)
-        # Add translation languages to context
-        if self._translation_langs:
-            _ctx["translation_lang_codes"] = self._translation_langs
         return _ctx
 
     def _build_authenticate_payload(self):
@@ -224,6 +335,109 @@ class OdooAPI(object):
         else:
             raise IDMissingInBackend("ID {} not found in backend".format(res_id))
 
+    def read_many(
+        self,
+        model,
+        res_ids,
+        fields=None,
+        chunk_size=READ_CHUNK_SIZE,
+        context=None,
+        get_passive=None,
+    ):
+        """
+        Read several records with one search_read per chunk of ids.
+        Returns a dictionary of records by id, the ids which are not found
+        in the backend are left out.
+        """
+        res_ids = list(dict.fromkeys(res_ids))
+        result = {}
+        for index in range(0, len(res_ids), chunk_size):
+            records = self.search(
+                model,
+                [["id", "in", res_ids[index : index + chunk_size]]],
+                fields=fields,
+                context=context,
+                get_passive=get_passive,
+            )
+            for record in records or []:
+                result[record["id"]] = record
+        return result
+
+    def read_many_parallel(
+        self, reads, chunk_size=READ_CHUNK_SIZE, max_workers=FETCH_WORKERS
+    ):
+        """
+        Run several read_many at once, their chunks being read by a bounded
+        pool of threads. ``reads`` is a dictionary of key: read_many
+        arguments (model, res_ids, fields, context, get_passive). Returns
+        a dictionary of key: records by id.
+
+        Only HTTP requests are made in the threads, the caller must not
+        pass anything bound to the database cursor.
+        """
+        tasks = []
+        for key, params in reads.items():
+            res_ids = list(dict.fromkeys(params["res_ids"]))
+            for index in range(0, len(res_ids), chunk_size):
+                chunk = res_ids[index : index + chunk_size]
+                tasks.append((key, dict(params, res_ids=chunk)))
+        result = {key: {} for key in reads}
+        if not tasks:
+            return result
+        max_workers = max(1, min(max_workers, len(tasks)))
+        stats = current_rpc_stats()
+
+        def read_chunk(params):
+            # The calls of the threads are counted by the caller's collector
+            _rpc_stats_local.stats = stats
+            try:
+                return self.read_many(chunk_size=chunk_size, **params)
+            finally:
+                _rpc_stats_local.stats = None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                (key, executor.submit(read_chunk, params)) for key, params in tasks
+            ]
+            for key, future in futures:
+                result[key].update(future.result())
+        return result
+
+    def get_reference_records(self, model, refresh=False):
+        """
+        Return all the records of a small remote table that almost never
+        changes (countries, states...), by id. The table is read once and
+        kept by the client for REFERENCE_TTL seconds, so it is shared by
+        all the jobs using the same pooled client.
+        """
+        now = time.monotonic()
+        with self._reference_lock:
+            expiry, records = self._reference_cache.get(model, (0, None))
+        if records is not None and expiry > now and not refresh:
+            return records
+        records = {
+            record["id"]: record
+            for record in self.search(
+                model, [], fields=REFERENCE_FIELDS.get(model, ["id", "name"])
+            )
+            or []
+        }
+        with self._reference_lock:
+            self._reference_cache[model] = (now + REFERENCE_TTL, records)
+        return records
+
+    def get_reference_record(self, model, res_id):
+        """
+        Return one record of a reference table, the table is read again
+        once when the record is not found in it.
+        """
+        record = self.get_reference_records(model).get(res_id)
+        if record is None:
+            record = self.get_reference_records(model, refresh=True).get(res_id)
+        if record is None:
+            raise IDMissingInBackend("ID {} not found in backend".format(res_id))
+        return record
+
     def unlink(self, res_id):
         raise NotImplementedError
 
@@ -240,3 +454,50 @@ class OdooAPI(object):
                 ],
             )
         )
+
+
+class OdooAPIPool(object):
+    """
+    Process-wide registry of OdooAPI clients.
+
+    Clients are shared by every job of a worker process. They are keyed by
+    backend and stored along with a fingerprint of the credentials they were
+    built with, a client whose fingerprint doesn't match anymore is replaced.
+    The language is not part of the credentials, it is sent with each call
+    by the clients returned by ``OdooAPI.with_context``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+
+    @staticmethod
+    def fingerprint(params):
+        return md5(repr(sorted(params.items())).encode("utf-8")).hexdigest()
+
+    def get(self, key, params):
+        """Return the pooled client for ``key``, build it with ``params``
+        if it does not exist yet or if the credentials have changed."""
+        fingerprint = self.fingerprint(params)
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry and entry[0] == fingerprint:
+                return entry[1]
+        # Build outside of the lock, it may need a login round trip.
+        client = OdooAPI(**params)
+        if not client._uid:
+            # Do not keep a client which failed to authenticate
+            return client
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry and entry[0] == fingerprint:
+                return entry[1]
+            self._clients[key] = (fingerprint, client)
+        return client
+
+    def invalidate(self, key):
+        with self._lock:
+            self._clients.pop(key, None)
+
+
+odoo_api_pool = OdooAPIPool()
@@ -0,0 +1,168 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+"""
+
+Import planner for Odoo.
+
+The planner reads a batch of records, collects the records they depend
+on from the fetched data and sorts the whole closure in levels, so
+that the dependencies are imported before the records using them,
+once per batch.
+
+The records are fetched by waves, the records of a wave and the
+dependencies they reference being read with concurrent requests of a
+bounded thread pool. The threads only make HTTP requests: the database
+is accessed by the main thread only, between the waves and when the
+levels are applied, which keeps the transactions short.
+
+"""
+
+import logging
+
+from odoo.addons.component.core import Component
+
+_logger = logging.getLogger(__name__)
+
+
+class OdooImportPlanner(Component):
+    """Plan the import of a batch of records and of their dependencies"""
+
+    _name = "odoo.import.planner"
+    _inherit = "base.odoo.connector"
+    _usage = "import.planner"
+
+    def _get_importer(self, binding_model):
+        return self.component(usage="record.importer", model_name=binding_model)
+
+    def _get_read_params(self, binding_model, external_ids, fields):
+        """Return the arguments of the remote read of records of a binding
+        model. They are plain values, safe to use in the fetch threads."""
+        adapter = self.component(usage="backend.adapter", model_name=binding_model)
+        return {
+            "model": adapter._odoo_model,
+            "res_ids": external_ids,
+            "fields": fields,
+            "get_passive": adapter._get_passive,
+        }
+
+    def _fetch(self, reads):
+        """Read the records of several binding models with concurrent
+        requests, without any access to the database"""
+        return self.work.odoo_api.read_many_parallel(
+            reads, max_workers=self.backend_record.import_fetch_workers or 1
+        )
+
+    def _select_outdated(self, candidates, force=False):
+        """Return the dependencies which have to be imported, by binding
+        model: the ones which are not bound yet or which changed since
+        their last import. The other ones are marked as imported for the
+        job."""
+        outdated = {}
+        bindings = {}
+        probes = {}
+        for binding_model, external_ids in candidates.items():
+            importer = self._get_importer(binding_model)
+            model_force = importer._check_force_available(force=force)
+            binder = self.binder_for(binding_model)
+            model_bindings = {
+                binding.external_id: binding
+                for binding in binder.to_internal_many(external_ids)
+            }
+            outdated[binding_model] = [
+                external_id
+                for external_id in external_ids
+                if model_force
+                or external_id not in model_bindings
+                or not model_bindings[external_id].sync_date
+            ]
+            bound_ids = [
+                external_id
+                for external_id in external_ids
+                if external_id not in outdated[binding_model]
+            ]
+            if bound_ids:
+                bindings[binding_model] = model_bindings
+                probes[binding_model] = self._get_read_params(
+                    binding_model, bound_ids, ["write_date"]
+                )
+        imported = self.work.imported_dependencies
+        for binding_model, records in self._fetch(probes).items():
+            importer = self._get_importer(binding_model)
+            for external_id in probes[binding_model]["res_ids"]:
+                record = records.get(external_id)
+                if record and importer._is_date_uptodate(
+                    bindings[binding_model][external_id], record.get("write_date")
+                ):
+                    imported.add((binding_model, external_id))
+                else:
+                    outdated[binding_model].append(external_id)
+        return outdated
+
+    def _sort_levels(self, dependencies):
+        """Sort the records in levels, each record coming after the
+        records it depends on. The records of a cycle are put in the
+        last level."""
+        remaining = set(dependencies)
+        levels = []
+        while remaining:
+            level = [
+                node
+                for node in remaining
+                if not any(dep in remaining for dep in dependencies[node])
+            ]
+            if not level:
+                _logger.info(
+                    "Dependency cycle between %s records, importing them together",
+                    len(remaining),
+                )
+                level = list(remaining)
+            remaining.difference_update(level)
+            levels.append(sorted(level))
+        return levels
+
+    def plan(self, external_ids, force=False):
+        """Return the records to import for ``external_ids``, as a list of
+        levels of (binding model, external id), the dependencies first.
+
+        :param external_ids: external ids of records of the work model
+        :param force: if True, the bound dependencies are imported even
+                      if they did not change
+        """
+        dependencies = {}
+        wave = {self.work.model_name: list(dict.fromkeys(external_ids))}
+        seen = {(self.work.model_name, external_id) for external_id in external_ids}
+        prefetched = self.work.prefetched_records
+        root = True
+        while wave:
+            if not root:
+                wave = self._select_outdated(wave, force=force)
+            root = False
+            importers = {
+                binding_model: self._get_importer(binding_model)
+                for binding_model, model_ids in wave.items()
+                if model_ids
+            }
+            # Phase 1: fetch the whole wave concurrently
+            reads = {
+                binding_model: self._get_read_params(
+                    binding_model, wave[binding_model], importer._get_read_fields()
+                )
+                for binding_model, importer in importers.items()
+            }
+            results = self._fetch(reads)
+            wave = {}
+            for binding_model, records in results.items():
+                importer = importers[binding_model]
+                for external_id in reads[binding_model]["res_ids"]:
+                    node = (binding_model, external_id)
+                    record = records.get(external_id)
+                    prefetched[node] = record
+                    dependencies[node] = (
+                        importer._get_dependencies(record) if record else []
+                    )
+                    for dependency in dependencies[node]:
+                        if dependency in seen:
+                            continue
+                        seen.add(dependency)
+                        wave.setdefault(dependency[0], []).append(dependency[1])
+        return self._sort_levels(dependencies)
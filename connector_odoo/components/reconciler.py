@@ -0,0 +1,178 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl).
+
+"""
+
+Reconciler for Odoo.
+
+The reconciler detects the records deleted on the backend: the bindings
+whose external id does not exist anymore on the backend. The remote ids
+are read by pages ordered by id and kept in a sorted array of integers,
+the local external ids are read by pages from the binding table in the
+same order, and both sequences are merged in a single pass.
+
+"""
+
+import logging
+from array import array
+
+from odoo.addons.component.core import Component
+
+_logger = logging.getLogger(__name__)
+
+
+class OdooReconciler(Component):
+    """Find and process the bindings of records deleted on the backend"""
+
+    _name = "odoo.reconciler"
+    _inherit = "base.odoo.connector"
+    _usage = "reconciler"
+
+    # Number of ids read with one remote request or one SQL query
+    _page_size = 5000
+
+    def _get_remote_ids(self):
+        """Return the sorted ids of all the records of the backend, the
+        archived ones included, as an array of unsigned integers. The
+        remote model is the one searched by the batch importer."""
+        adapter = self.component(usage="backend.adapter")
+        remote_model = (
+            self.component(usage="batch.importer")._search_model or adapter._odoo_model
+        )
+        remote_ids = array("L")
+        last_id = 0
+        while True:
+            page = self.work.odoo_api.search(
+                model=remote_model,
+                domain=[("id", ">", last_id)],
+                fields=["id"],
+                limit=self._page_size,
+                order="id",
+                context={"active_test": False},
+            )
+            remote_ids.extend(record["id"] for record in page)
+            if len(page) < self._page_size:
+                return remote_ids
+            last_id = page[-1]["id"]
+
+    def _iter_local_ids(self):
+        """Yield the (external id, binding id) of the bindings of the
+        backend, ordered by external id"""
+        self.model.flush_model(["backend_id", "external_id"])
+        query = """
+            SELECT external_id, id
+            FROM {}
+            WHERE backend_id = %s AND external_id > %s
+            ORDER BY external_id
+            LIMIT %s
+        """.format(
+            self.model._table
+        )
+        last_id = 0
+        while True:
+            self.env.cr.execute(
+                query, (self.backend_record.id, last_id, self._page_size)
+            )
+            rows = self.env.cr.fetchall()
+            yield from rows
+            if len(rows) < self._page_size:
+                return
+            last_id = rows[-1][0]
+
+    def _get_tombstones(self, remote_ids):
+        """Return the ids of the bindings whose external id is not in the
+        sorted ``remote_ids``, merging both sequences. The bindings of
+        records created after the last remote id are ignored."""
+        tombstones = []
+        index, count = 0, len(remote_ids)
+        for external_id, binding_id in self._iter_local_ids():
+            if external_id > remote_ids[-1]:
+                # Created on the backend after the remote ids were read
+                break
+            while index < count and remote_ids[index] < external_id:
+                index += 1
+            if index == count or remote_ids[index] != external_id:
+                tombstones.append(binding_id)
+        return tombstones
+
+    def _get_shared_records(self, records):
+        """Return the records of ``records`` bound on another backend"""
+        return (
+            self.model.with_context(active_test=False)
+            .search(
+                [
+                    ("odoo_id", "in", records.ids),
+                    ("backend_id", "!=", self.backend_record.id),
+                ]
+            )
+            .mapped("odoo_id")
+        )
+
+    def _process_records(self, records, action):
+        if action == "unlink":
+            # The bindings are deleted with their records
+            records.unlink()
+        else:
+            records.write({"active": False})
+
+    def _process_tombstones(self, bindings, action):
+        """Archive or delete the records of the bindings.
+
+        The records still bound on another backend are kept, only the
+        bindings of this backend are deleted. When a page fails, its
+        records are processed one by one and the failures are logged.
+        """
+        records = bindings.mapped("odoo_id")
+        shared = self._get_shared_records(records)
+        if shared:
+            if action == "unlink":
+                bindings.filtered(lambda binding: binding.odoo_id in shared).unlink()
+            records -= shared
+        if action == "archive" and "active" not in records._fields:
+            _logger.info(
+                "%s cannot be archived, %s deleted records kept",
+                records._name,
+                len(records),
+            )
+            return
+        try:
+            with self.env.cr.savepoint():
+                self._process_records(records, action)
+        except Exception:
+            for record in records:
+                try:
+                    with self.env.cr.savepoint():
+                        self._process_records(record, action)
+                except Exception as e:
+                    _logger.warning(
+                        "%s(%s) deleted on the backend could not be processed: %s",
+                        record._name,
+                        record.id,
+                        e,
+                    )
+
+    def run(self):
+        """Detect the records deleted on the backend and process them
+        according to the reconciliation action of the backend. Returns
+        the number of deleted records found."""
+        remote_ids = self._get_remote_ids()
+        if not remote_ids:
+            _logger.warning(
+                "%s: no record on the backend, nothing is reconciled",
+                self.model._name,
+            )
+            return 0
+        tombstones = self._get_tombstones(remote_ids)
+        _logger.info(
+            "%s: %s records on the backend, %s deleted",
+            self.model._name,
+            len(remote_ids),
+            len(tombstones),
+        )
+        action = self.backend_record.reconcile_action
+        if tombstones and action != "none":
+            for start in range(0, len(tombstones), self._page_size):
+                bindings = self.model.browse(
+                    tombstones[start : start + self._page_size]
+                )
+                self._process_tombstones(bindings, action)
+        return len(tombstones)
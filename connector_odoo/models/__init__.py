@@ -4,6 +4,12 @@ from . import queue_job
 
 from . import odoo_binding  # Keep this order for inheritance
 from . import odoo_backend
+from . import odoo_remote_record_cache
+from . import odoo_rpc_stats_report
+from . import odoo_import_span
+from . import odoo_job_spawner
+from . import odoo_channel_assignment
+from . import odoo_sync_state
 
 from . import base_multi_image_image
 from . import res_currency_rate
@@ -23,14 +23,13 @@ class AccountAccountBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        external_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo Account Account %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class AccountAccountImportMapper(Component):
@@ -77,8 +76,8 @@ class AccountAccountImportMapper(Component):
             self.env["account.account"]._fields["account_type"].selection,
         )
         if record["user_type_id"]:
-            external_type = self.work.odoo_api.browse(
-                model="account.account.type", res_id=record["user_type_id"][0]
+            external_type = self.work.odoo_api.get_reference_record(
+                "account.account.type", record["user_type_id"][0]
             )
             if external_type["type"] in available_types:
                 vals = {"account_type": external_type["type"]}
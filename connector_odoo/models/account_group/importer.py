@@ -23,14 +23,13 @@ class AccountGroupBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        external_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo Account Group %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class AccountGroupImportMapper(Component):
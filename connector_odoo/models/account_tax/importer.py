@@ -23,14 +23,13 @@ class AccountTaxBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        external_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo Account Group %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class AccountTaxImportMapper(Component):
@@ -107,12 +106,8 @@ class AccountTaxImportMapper(Component):
         vals = {"children_tax_ids": []}
         binder = self.binder_for("odoo.account.tax")
         if record["amount_type"] == "group":
-            children = []
-            for tax_id in record["children_tax_ids"]:
-                local_tax = binder.to_internal(tax_id, unwrap=True)
-                if local_tax:
-                    children.append(local_tax.id)
-            vals.update({"children_tax_ids": [(6, 0, children)]})
+            children = binder.to_internal_many(record["children_tax_ids"], unwrap=True)
+            vals.update({"children_tax_ids": [(6, 0, children.ids)]})
         return vals
 
 
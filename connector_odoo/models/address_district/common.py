@@ -9,6 +9,7 @@ _logger = logging.getLogger(__name__)
 
 class OdooAddressDistrict(models.Model):
     _queue_priority = 15
+    _import_chunk_size = 200
     _name = "odoo.address.district"
     _inherit = "odoo.binding"
     _inherits = {"address.district": "odoo_id"}
@@ -19,14 +19,13 @@ class AddressDistrictBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        external_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo Address District %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class AddressDistrictImportMapper(Component):
@@ -66,8 +65,8 @@ class AddressDistrictImportMapper(Component):
     @mapping
     def state_id(self, record):
         ctx = {"lang": self.backend_record.get_default_language_code()}
-        remote_state = self.work.odoo_api.browse(
-            model="res.country.state", res_id=record["state_id"][0]
+        remote_state = self.work.odoo_api.get_reference_record(
+            "res.country.state", record["state_id"][0]
         )
         state_record = (
             self.env["res.country.state"]
@@ -107,3 +106,5 @@ class AddressDistrictImporter(Component):
     _name = "odoo.address.district.importer"
     _inherit = "odoo.importer"
     _apply_on = ["odoo.address.district"]
+
+    _import_bulk = True
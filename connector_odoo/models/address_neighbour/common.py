@@ -9,6 +9,7 @@ _logger = logging.getLogger(__name__)
 
 class OdooAddressNeighbour(models.Model):
     _queue_priority = 15
+    _import_chunk_size = 200
     _name = "odoo.address.neighbour"
     _inherit = "odoo.binding"
     _inherits = {"address.neighbour": "odoo_id"}
@@ -9,6 +9,7 @@ _logger = logging.getLogger(__name__)
 
 class OdooAddressRegion(models.Model):
     _queue_priority = 15
+    _import_chunk_size = 200
     _name = "odoo.address.region"
     _inherit = "odoo.binding"
     _inherits = {"address.region": "odoo_id"}
@@ -19,14 +19,13 @@ class AddressRegionBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        external_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo Address Region %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class AddressRegionImportMapper(Component):
@@ -84,6 +83,8 @@ class AddressRegionImporter(Component):
     _inherit = "odoo.importer"
     _apply_on = ["odoo.address.region"]
 
+    _import_bulk = True
+
     def _import_dependencies(self, force=False):
         """Import the dependencies for the record"""
         record = self.odoo_record
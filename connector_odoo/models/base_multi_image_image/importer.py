@@ -15,22 +15,26 @@ class BaseMultiImageImageBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.base_multi_image.image"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
+    _search_model = "base_multi_image.image"
 
+    def _get_batch_domain(self, domain):
         # We only want to import images that are related to products.
-        domain += [["owner_model", "in", ("product.template", "product.product")]]
+        return super()._get_batch_domain(domain) + [
+            ["owner_model", "in", ("product.template", "product.product")]
+        ]
 
-        external_ids = self.backend_adapter.search(
-            domain, model="base_multi_image.image"
+    def run(self, domain=None, force=False):
+        """Run the synchronization"""
+        domain = self._get_batch_domain(domain)
+        external_ids = self.backend_adapter.iter_search(
+            domain, model=self._search_model
         )
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo base multi images %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class BaseMultiImageImageMapper(Component):
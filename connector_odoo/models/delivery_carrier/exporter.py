@@ -15,19 +15,19 @@ class BatchUserExporter(Component):
     _apply_on = ["odoo.delivery.carrier"]
     _usage = "batch.exporter"
 
-    def run(self, domain=None, force=False):
+    def _get_local_records(self, domain):
         loc_filter = ast.literal_eval(self.backend_record.local_user_domain_filter)
-        domain += loc_filter
-        user_ids = self.env["delivery.carrier"].search(domain)
+        return self.env["delivery.carrier"].search(list(domain or []) + loc_filter)
 
+    def _prepare_bindings(self, domain):
+        carrier_ids = self._get_local_records(domain)
         o_ids = self.env["odoo.delivery.carrier"].search(
             [("backend_id", "=", self.backend_record.id)]
         )
-        o_user_ids = self.env["delivery.carrier"].search(
+        o_carrier_ids = self.env["delivery.carrier"].search(
             [("id", "in", [o.odoo_id.id for o in o_ids])]
         )
-        to_bind = user_ids - o_user_ids
-
+        to_bind = carrier_ids - o_carrier_ids
         for p in to_bind:
             self.env["odoo.delivery.carrier"].create(
                 {
@@ -37,14 +37,16 @@ class BatchUserExporter(Component):
                 }
             )
 
-        bind_ids = self.env["odoo.delivery.carrier"].search(
-            [
-                ("odoo_id", "in", [p.id for p in user_ids]),
-                ("backend_id", "=", self.backend_record.id),
-            ]
-        )
-        for carrier in bind_ids:
-            self._export_record(carrier)
+    def _get_batch_domain(self, domain):
+        return [
+            ("odoo_id", "in", self._get_local_records(domain).ids),
+            ("backend_id", "=", self.backend_record.id),
+        ]
+
+    def run(self, domain=None, force=False):
+        self._prepare_bindings(domain)
+        for binding in self.model.search(self._get_batch_domain(domain)):
+            self._export_record(binding)
 
 
 class OdooUserExporter(Component):
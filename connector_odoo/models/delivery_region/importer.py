@@ -19,14 +19,13 @@ class DeliveryRegionBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        external_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for delivery regions %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
     # def _import_dependencies(self, force=False):
     #     """Import the dependencies for the record"""
@@ -50,12 +49,13 @@ class DeliveryRegionMapper(Component):
         res = {"country_ids": False}
         countries = record.get("country_ids")
         if countries:
-            external_countries = self.work.odoo_api.search(
-                model="res.country", domain=[("id", "in", countries)]
-            )
-            local_countries = self.env["res.country"].search(
-                [("code", "in", [x["code"] for x in external_countries])]
-            )
+            external_countries = self.work.odoo_api.get_reference_records("res.country")
+            codes = [
+                external_countries[country_id]["code"]
+                for country_id in countries
+                if country_id in external_countries
+            ]
+            local_countries = self.env["res.country"].search([("code", "in", codes)])
             res["country_ids"] = [(6, 0, local_countries.ids)]
         return res
 
@@ -66,8 +66,8 @@ class DeliveryRegionMapper(Component):
         states = record.get("state_ids")
         if states:
             for state in states:
-                external_state = self.work.odoo_api.browse(
-                    model="res.country.state", res_id=state
+                external_state = self.work.odoo_api.get_reference_record(
+                    "res.country.state", state
                 )
                 local_state = self.env["res.country.state"].search(
                     [
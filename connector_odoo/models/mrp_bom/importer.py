@@ -16,8 +16,7 @@ class MrpBomBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.mrp.bom"]
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
+    def _get_batch_domain(self, domain):
         imported_products = (
             self.env["odoo.product.template"]
             .search(
@@ -29,15 +28,20 @@ class MrpBomBatchImporter(Component):
             )
             .mapped("external_id")
         )
-        domain.append(("product_tmpl_id", "in", imported_products))
-        external_ids = self.backend_adapter.search(domain)
+        return super()._get_batch_domain(domain) + [
+            ("product_tmpl_id", "in", imported_products)
+        ]
+
+    def run(self, domain=None, force=False):
+        """Run the synchronization"""
+        domain = self._get_batch_domain(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for delivery regions %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class MrpBomMapper(Component):
@@ -9,10 +9,22 @@ from odoo import _, api, fields, models
 from odoo.exceptions import UserError
 
 # pylint: disable=W7950
-from odoo.addons.connector_odoo.components.odoo_api import OdooAPI
+from odoo.addons.connector_odoo.components.odoo_api import odoo_api_pool
 
 IMPORT_DELTA_BUFFER = 30  # seconds
 
+# Changing one of these fields invalidates the pooled connection
+CONNECTION_FIELDS = {
+    "hostname",
+    "port",
+    "protocol",
+    "database",
+    "login",
+    "password",
+    "timeout",
+    "uid",
+}
+
 _logger = logging.getLogger(__name__)
 
 
@@ -111,6 +123,85 @@ class OdooBackend(models.Model):
         help="""External ID for Public website user on Odoo 12.0.""",
     )
 
+    """
+    PERFORMANCE FIELDS
+    """
+
+    remote_cache_ttl = fields.Integer(
+        string="Remote Cache TTL (s)",
+        default=86400,
+        help="Records read on the backend are kept in a shared cache for "
+        "this number of seconds after their last use. 0 disables the cache.",
+    )
+    remote_cache_max_rows = fields.Integer(
+        string="Remote Cache Size",
+        default=100000,
+        help="Maximum number of records kept in the remote record cache, "
+        "the least recently used ones are removed first.",
+    )
+    import_span_sample_rate = fields.Float(
+        string="Timing Sample Rate",
+        default=0.01,
+        help="Share of the import jobs which store the duration of their "
+        "phases, between 0 and 1. 0 disables the timing spans.",
+    )
+    import_commit_size = fields.Integer(
+        string="Commit Every N Records",
+        default=50,
+        help="Chunk imports commit after this number of records. "
+        "0 commits once at the end of the job.",
+    )
+    import_fetch_workers = fields.Integer(
+        string="Concurrent Fetches",
+        default=4,
+        help="Number of concurrent requests reading the records of a chunk "
+        "import and their dependencies.",
+    )
+    import_commit_interval = fields.Integer(
+        string="Commit Every (ms)",
+        default=2000,
+        help="Chunk imports also commit when this time elapsed since the "
+        "last commit. 0 disables it.",
+    )
+    spawner_max_pending = fields.Integer(
+        string="Max Pending Jobs per Channel",
+        default=500,
+        help="Batch imports and exports delay their jobs by slices, keeping "
+        "at most this number of jobs waiting in the channel of the model. "
+        "0 delays all the jobs of a batch at once.",
+    )
+    spawner_poll_interval = fields.Integer(
+        string="Spawner Poll Interval (s)",
+        default=60,
+        help="Delay before a batch checks again a full channel.",
+    )
+    reconcile_action = fields.Selection(
+        selection=[
+            ("none", "Report Only"),
+            ("archive", "Archive"),
+            ("unlink", "Delete"),
+        ],
+        string="Deleted Remote Records",
+        default="none",
+        required=True,
+        help="What the reconciliation does with the local records whose "
+        "record was deleted on the backend.",
+    )
+    sync_state_ids = fields.One2many(
+        comodel_name="odoo.sync.state",
+        inverse_name="backend_id",
+        string="Synchronization Cursors",
+        help="Last record imported of each binding model, the next imports "
+        "start after it.",
+    )
+    channel_assignment_ids = fields.One2many(
+        comodel_name="odoo.channel.assignment",
+        inverse_name="backend_id",
+        string="Job Channels",
+        help="Channels of the binding models, overriding the channels "
+        "computed from their names.",
+    )
+
     """
     DOMAIN FIELDS
     """
@@ -194,18 +285,61 @@ class OdooBackend(models.Model):
     def get_translation_lang_codes(self):
         return self.translation_lang_ids.mapped("code")
 
+    def _get_connection_params(self):
+        self.ensure_one()
+        return {
+            "base_url": self.protocol + "://" + self.hostname + ":" + str(self.port),
+            "db": self.database,
+            "login": self.login,
+            "password": self.password,
+            "timeout": self.timeout,
+            "uid": self.uid,
+        }
+
+    def _get_connection_context(self):
+        """Context sent with each call, it depends on the current user"""
+        self.ensure_one()
+        context = {"lang": self.get_default_language_code()}
+        translation_langs = self.get_translation_lang_codes()
+        if translation_langs:
+            context["translation_lang_codes"] = translation_langs
+        return context
+
+    def _get_connection_key(self):
+        return self.env.cr.dbname, self.id
+
     def get_connection(self):
+        """Return the OdooAPI client of the backend. Clients are pooled per
+        worker process, so jobs reuse the keep-alive connections and the
+        login of the previous ones."""
         self.ensure_one()
-        return OdooAPI(
-            base_url=self.protocol + "://" + self.hostname + ":" + str(self.port),
-            db=self.database,
-            login=self.login,
-            password=self.password,
-            timeout=self.timeout,
-            uid=self.uid,
-            default_lang=self.get_default_language_code(),
-            translation_langs=self.get_translation_lang_codes(),
+        client = odoo_api_pool.get(
+            self._get_connection_key(), self._get_connection_params()
         )
+        return client.with_context(**self._get_connection_context())
+
+    def _invalidate_connection(self):
+        for backend in self:
+            odoo_api_pool.invalidate(backend._get_connection_key())
+
+    def write(self, vals):
+        res = super(OdooBackend, self).write(vals)
+        if CONNECTION_FIELDS.intersection(vals):
+            self._invalidate_connection()
+        date_fields = [
+            name
+            for name in vals
+            if name.startswith("import_") and name.endswith("_from_date")
+        ]
+        if date_fields:
+            self.env["odoo.sync.state"].search(
+                [("backend_id", "in", self.ids), ("date_field", "in", date_fields)]
+            )._restart()
+        return res
+
+    def unlink(self):
+        self._invalidate_connection()
+        return super(OdooBackend, self).unlink()
 
     def button_check_connection(self):
         odoo_api = self.get_connection()
@@ -227,6 +361,12 @@ class OdooBackend(models.Model):
         lang = self.get_default_language_code()
         _conn = self.get_connection()
         _super = super(OdooBackend, self.with_context(lang=lang))
+        # External ID -> binding IDs cache shared by the binders
+        kwargs.setdefault("binder_cache", {})
+        # Remote write dates read ahead of the imports
+        kwargs.setdefault("write_date_probes", {})
+        # (binding model, external ID) of the records imported in the job
+        kwargs.setdefault("imported_dependencies", set())
         # from the components we'll be able to do: self.work.odoo_api
         with _super.work_on(model_name, odoo_api=_conn, **kwargs) as work:
             yield work
@@ -278,26 +418,26 @@ class OdooBackend(models.Model):
         backends = self._get_backends()
         for backend in backends:
             for model in models:
-                next_time = self._cron_import(
-                    model, date_field, backend, is_single=False
-                )
-            backend.write({date_field: next_time})
+                self._cron_import(model, date_field, backend)
         return True
 
-    def _cron_import(self, model_name, from_date_field, backend, is_single=True):
+    def _cron_import(self, model_name, from_date_field, backend=None):
         """
         Base method to import data from Odoo with cron.
+
+        Each binding model has its own synchronization cursor. It starts
+        from the date field on its first run, and goes back to it when the
+        date field is changed.
         """
-        # When we call this method for a single model, we pass the field name
-        # Otherwise we pass the field itself to avoid time inconsistencies
-        # between grouped models.
-        from_date = getattr(backend, from_date_field)
-        next_time = backend._import_from_date(model_name, from_date)
-        if next_time and is_single:
-            backend.write({from_date_field: next_time})
-            return True
-        else:
-            return next_time
+        for backend in backend or self._get_backends():
+            backend._import_from_sync_state(model_name, from_date_field)
+        return True
+
+    def _import_from_sync_state(self, model, date_field=None):
+        """Import the records of ``model`` modified after its cursor"""
+        self.ensure_one()
+        state = self.env["odoo.sync.state"]._get_state(self, model, date_field)
+        return state._import_batch()
 
     def action_fix_category_seo_name(self):
         self.ensure_one()
@@ -372,26 +512,6 @@ class OdooBackend(models.Model):
         date_field = "import_utm_models_from_date"
         return self._cron_multi_import(models=utm_models, date_field=date_field)
 
-    def _get_next_import_time(self, import_start_time):
-        next_time = import_start_time - timedelta(seconds=IMPORT_DELTA_BUFFER)
-        return fields.Datetime.to_string(next_time)
-
-    def _import_from_date(self, model, from_date_field):
-        import_start_time = datetime.now()
-        domain = [("write_date", "<", fields.Datetime.to_string(import_start_time))]
-        for backend in self:
-            if from_date_field:
-                from_date = fields.Datetime.to_string(from_date_field)
-                domain.append(
-                    (
-                        "write_date",
-                        ">",
-                        from_date,
-                    )
-                )
-            self.env[model].delayed_import_batch(backend, domain)
-        return self._get_next_import_time(import_start_time)
-
     def import_external_id(self, model, external_id, force):
         model = self.env[model]
         for backend in self:
@@ -407,27 +527,34 @@ class OdooBackend(models.Model):
                 domain.append(("write_date", ">", from_date))
             else:
                 from_date = None
-            self.env[model].with_delay().export_batch(backend, domain)
+            if backend.spawner_max_pending:
+                self.env["odoo.job.spawner"]._spawn(backend, model, "export", domain)
+            else:
+                self.env[model].with_delay().export_batch(backend, domain)
         next_time = import_start_time - timedelta(seconds=IMPORT_DELTA_BUFFER)
         next_time = fields.Datetime.to_string(next_time)
         self.write({from_date_field: next_time})
 
     def _fix_address_district(self):
         self.ensure_one()
-        imported = self.env["odoo.address.district"].search([]).mapped("odoo_id")
-        self.env["address.district"].search([("id", "not in", imported.ids)]).unlink()
+        self.env["address.district"].search([("bind_ids", "=", False)]).unlink()
         return True
 
     def _fix_address_region(self):
         self.ensure_one()
-        imported = self.env["odoo.address.region"].search([]).mapped("odoo_id")
-        self.env["address.region"].search([("id", "not in", imported.ids)]).unlink()
+        self.env["address.region"].search([("bind_ids", "=", False)]).unlink()
         return True
 
     def _fix_address_neighbour(self):
         self.ensure_one()
-        imported = self.env["odoo.address.neighbour"].search([]).mapped("odoo_id")
-        self.env["address.neighbour"].search([("id", "not in", imported.ids)]).unlink()
+        self.env["address.neighbour"].search([("bind_ids", "=", False)]).unlink()
+        return True
+
+    def _cron_reconcile(self, models):
+        """Delay the reconciliation of the records deleted on the backends"""
+        for backend in self._get_backends():
+            for model in models:
+                self.env[model].delayed_reconcile(backend)
         return True
 
     def action_fix_address_models(self):
@@ -3,7 +3,9 @@
 from odoo import _, api, fields, models
 from odoo.exceptions import ValidationError
 from odoo.addons.connector.exception import RetryableJobError
+from odoo.addons.connector_odoo.components.odoo_api import RPCStats
 from hashlib import md5
+import random
 import time
 
 
@@ -19,6 +21,10 @@ class OdooBinding(models.AbstractModel):
     _inherit = "external.binding"
     _description = "Odoo Binding (abstract)"
 
+    # Number of records imported by a single job of a batch import,
+    # 0 delays one job per record
+    _import_chunk_size = 0
+
     # odoo_id = odoo-side id must be declared in concrete model
     backend_id = fields.Many2one(
         comodel_name="odoo.backend",
@@ -27,6 +33,13 @@ class OdooBinding(models.AbstractModel):
         ondelete="restrict",
     )
     external_id = fields.Integer(string="ID on Ext Odoo", required=False)
+    sync_hash = fields.Char(
+        string="Remote Data Hash",
+        copy=False,
+        readonly=True,
+        help="Fingerprint of the remote data of the last import, "
+        "used to skip the records which did not change.",
+    )
     active_job_ids = fields.One2many(
         "queue.job",
         compute="_compute_active_job_ids",
@@ -73,6 +86,21 @@ class OdooBinding(models.AbstractModel):
 
         Priority of the job, 0 being the higher priority.
         """
+        return self._get_channel_name(self[:1].backend_id)
+
+    def _get_channel_name(self, backend):
+        """
+        Channel of the jobs of the model for ``backend``: the channel
+        assigned to the model on the backend, usually by the channel
+        allocation report, or the ``_special_channel`` of the model, or
+        the channel computed from the hash of the model name.
+        """
+        if backend:
+            channel = self.env["odoo.channel.assignment"]._get_channel(
+                backend, self._name
+            )
+            if channel:
+                return channel
         if hasattr(self, "_special_channel"):
             return self._special_channel
         md5_hash = md5(self._name.encode("utf-8")).hexdigest()
@@ -89,6 +117,14 @@ class OdooBinding(models.AbstractModel):
         else:
             return 99
 
+    @property
+    def _chunk_size(self):
+        """
+        Number of records imported by a single job of a batch import.
+        0 delays one job per record.
+        """
+        return self._import_chunk_size
+
     def resync(self):
         return self.delayed_import_record(self.backend_id, self.external_id, force=True)
 
@@ -132,24 +168,48 @@ class OdooBinding(models.AbstractModel):
 
     @api.model
     def delayed_import_batch(self, backend, domain=None, force=None):
+        if backend.spawner_max_pending:
+            return self.env["odoo.job.spawner"]._spawn(
+                backend, self._name, "import", domain=domain, force=force
+            )
         return (
             self.sudo()
             .with_delay(
-                channel=self._unique_channel_name,
+                channel=self._get_channel_name(backend),
                 priority=self._priority,
             )
             .import_batch(backend, domain=domain, force=force)
         )
 
+    @api.model
+    def _sample_import_spans(self, backend):
+        """Return the list collecting the timing spans of the job, or None
+        when the job is not sampled"""
+        rate = backend.import_span_sample_rate
+        if rate and random.random() < rate:
+            return []
+        return None
+
+    @api.model
+    def _store_job_stats(self, backend, stats, spans):
+        """Store the remote calls and the timing spans of the job"""
+        job_uuid = self._context.get("job_uuid")
+        self.env["queue.job"]._store_rpc_stats(job_uuid, stats)
+        if spans:
+            self.env["odoo.import.span"]._store_spans(backend, job_uuid, spans)
+
     @api.model
     def import_record(self, backend, external_id, force=False):
         """Import a Odoo record"""
-        with backend.work_on(self._name) as work:
+        spans = self._sample_import_spans(backend)
+        with backend.work_on(
+            self._name, import_spans=spans
+        ) as work, RPCStats() as stats:
             importer = work.component(usage="record.importer")
             importer.set_lock(external_id)
             importer._connect_with_job(self._context)
             try:
-                return importer.run(external_id, force=force)
+                res = importer.run(external_id, force=force)
             except Exception as e:
                 # Bağlantı hatalarında iş sürekli tekrar deneniyor ve delay olmadığı
                 # zaman retry_count çok hızlı bir şekilde doluyor. Delay ekleyerek
@@ -159,18 +219,53 @@ class OdooBinding(models.AbstractModel):
                     "Could not import record %s: \n%s" % (external_id, str(e)),
                     seconds=5,
                 )
+            self._store_job_stats(backend, stats, spans)
+            return res
+
+    @api.model
+    def import_records(self, backend, external_ids, force=False):
+        """Import a chunk of Odoo records"""
+        spans = self._sample_import_spans(backend)
+        with backend.work_on(
+            self._name,
+            prefetched_records={},
+            defer_commit=True,
+            import_spans=spans,
+        ) as work, RPCStats() as stats:
+            importer = work.component(usage="chunk.importer")
+            res = importer.run(external_ids, force=force)
+            self._store_job_stats(backend, stats, spans)
+            return res
 
     @api.model
     def delayed_import_record(self, backend, external_id, force=False):
         return (
             self.sudo()
             .with_delay(
-                channel=self._unique_channel_name,
+                channel=self._get_channel_name(backend),
                 priority=self._priority,
             )
             .import_record(backend, external_id, force=force)
         )
 
+    @api.model
+    def reconcile(self, backend):
+        """Process the bindings of the records deleted on the backend"""
+        with backend.work_on(self._name) as work:
+            reconciler = work.component(usage="reconciler")
+            return reconciler.run()
+
+    @api.model
+    def delayed_reconcile(self, backend):
+        return (
+            self.sudo()
+            .with_delay(
+                channel=self._get_channel_name(backend),
+                priority=self._priority,
+            )
+            .reconcile(backend)
+        )
+
     """
     EXPORTERS
     """
@@ -196,7 +291,7 @@ class OdooBinding(models.AbstractModel):
         return (
             self.sudo()
             .with_delay(
-                channel=self._unique_channel_name,
+                channel=self._get_channel_name(backend),
                 priority=self._priority,
             )
             .export_record(backend, local_id=local_id, fields=fields)
@@ -213,7 +308,7 @@ class OdooBinding(models.AbstractModel):
         return (
             self.sudo()
             .with_delay(
-                channel=self._unique_channel_name,
+                channel=self._get_channel_name(backend),
                 priority=self._priority + 50,
             )
             .execute_method(backend, model, method, args=args, context=context)
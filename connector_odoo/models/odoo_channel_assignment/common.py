@@ -0,0 +1,54 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from odoo import api, fields, models, tools
+
+
+class OdooChannelAssignment(models.Model):
+    """Job channel of a binding model for a backend, overriding the
+    channel computed from the hash of the model name"""
+
+    _name = "odoo.channel.assignment"
+    _description = "Odoo Job Channel Assignment"
+    _order = "backend_id, channel, model_name"
+
+    backend_id = fields.Many2one(
+        comodel_name="odoo.backend",
+        string="Odoo Backend",
+        required=True,
+        ondelete="cascade",
+    )
+    model_name = fields.Char(string="Binding Model", required=True)
+    channel = fields.Char(required=True, help="Complete name, such as root.3")
+
+    _sql_constraints = [
+        (
+            "backend_model_uniq",
+            "unique(backend_id, model_name)",
+            "A binding model can only be assigned to one channel by backend.",
+        )
+    ]
+
+    @api.model
+    @tools.ormcache()
+    def _get_assignments(self):
+        """Return the channels by (backend id, binding model)"""
+        return {
+            (assignment.backend_id.id, assignment.model_name): assignment.channel
+            for assignment in self.sudo().search([])
+        }
+
+    @api.model
+    def _get_channel(self, backend, model_name):
+        return self._get_assignments().get((backend.id, model_name))
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        self.clear_caches()
+        return super().create(vals_list)
+
+    def write(self, vals):
+        self.clear_caches()
+        return super().write(vals)
+
+    def unlink(self):
+        self.clear_caches()
+        return super().unlink()
@@ -0,0 +1,40 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+
+class OdooImportSpan(models.Model):
+    """Duration of a phase of a record import, stored for the jobs
+    sampled by the ``import_span_sample_rate`` of the backend"""
+
+    _name = "odoo.import.span"
+    _description = "Odoo Import Timing Span"
+    _order = "id desc"
+
+    backend_id = fields.Many2one(
+        comodel_name="odoo.backend",
+        string="Odoo Backend",
+        ondelete="cascade",
+        readonly=True,
+    )
+    job_uuid = fields.Char(string="Job UUID", index=True, readonly=True)
+    model_name = fields.Char(string="Binding Model", index=True, readonly=True)
+    external_id = fields.Integer(string="ID on Ext Odoo", readonly=True)
+    phase = fields.Char(readonly=True)
+    duration = fields.Float(string="Duration (ms)", readonly=True)
+
+    @api.model
+    def _store_spans(self, backend, job_uuid, spans):
+        return self.sudo().create(
+            [dict(span, backend_id=backend.id, job_uuid=job_uuid) for span in spans]
+        )
+
+    @api.model
+    def _cron_gc_spans(self, days=30):
+        """Remove the spans older than ``days`` days"""
+        limit = fields.Datetime.now() - timedelta(days=days)
+        self.env.cr.execute(
+            "DELETE FROM odoo_import_span WHERE create_date < %s", (limit,)
+        )
+        return True
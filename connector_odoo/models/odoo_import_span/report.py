@@ -0,0 +1,46 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from odoo import fields, models, tools
+
+
+class OdooImportSpanReport(models.Model):
+    """Median and 95th percentile duration of the import phases by
+    binding model"""
+
+    _name = "odoo.import.span.report"
+    _description = "Odoo Import Timing Report"
+    _auto = False
+    _order = "total_duration desc"
+
+    model_name = fields.Char(string="Binding Model", readonly=True)
+    phase = fields.Char(readonly=True)
+    span_count = fields.Integer(string="Count", readonly=True)
+    p50_duration = fields.Float(string="p50 (ms)", readonly=True, group_operator="max")
+    p95_duration = fields.Float(string="p95 (ms)", readonly=True, group_operator="max")
+    avg_duration = fields.Float(
+        string="Average (ms)", readonly=True, group_operator="avg"
+    )
+    total_duration = fields.Float(string="Total (ms)", readonly=True)
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute(
+            """
+            CREATE OR REPLACE VIEW {} AS (
+                SELECT
+                    min(id) AS id,
+                    model_name,
+                    phase,
+                    count(*) AS span_count,
+                    percentile_cont(0.5) WITHIN GROUP (ORDER BY duration)
+                        AS p50_duration,
+                    percentile_cont(0.95) WITHIN GROUP (ORDER BY duration)
+                        AS p95_duration,
+                    avg(duration) AS avg_duration,
+                    sum(duration) AS total_duration
+                FROM odoo_import_span
+                GROUP BY model_name, phase
+            )
+            """.format(
+                self._table
+            )
+        )
@@ -0,0 +1,193 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+import logging
+from datetime import timedelta
+
+from odoo import _, api, fields, models
+from odoo.tools.safe_eval import safe_eval
+
+_logger = logging.getLogger(__name__)
+
+# States of the jobs waiting for a worker
+WAITING_JOB_STATES = ("pending", "enqueued")
+
+
+class OdooJobSpawner(models.Model):
+    """Batch import or export delaying its jobs by slices.
+
+    Instead of delaying the jobs of all the records of a batch at once,
+    the spawner delays a slice of records, as many jobs as the channel of
+    the binding model has free slots, then enqueues itself again for the
+    next slice. The id of the last record of the slices is stored, so a
+    spawner interrupted by a restart resumes where it stopped.
+    """
+
+    _name = "odoo.job.spawner"
+    _description = "Odoo Batch Job Spawner"
+    _order = "id desc"
+
+    backend_id = fields.Many2one(
+        comodel_name="odoo.backend",
+        string="Odoo Backend",
+        required=True,
+        ondelete="cascade",
+        readonly=True,
+    )
+    model_name = fields.Char(string="Binding Model", required=True, readonly=True)
+    direction = fields.Selection(
+        selection=[("import", "Import"), ("export", "Export")],
+        required=True,
+        readonly=True,
+    )
+    domain = fields.Text(default="[]", readonly=True)
+    force = fields.Boolean(readonly=True)
+    max_pending = fields.Integer(
+        string="Max Pending Jobs",
+        readonly=True,
+        help="Maximum number of jobs waiting in the channel of the binding "
+        "model, the next slice is delayed when the channel drains.",
+    )
+    last_id = fields.Integer(
+        string="Cursor",
+        readonly=True,
+        help="ID of the last record delayed, remote for the imports and "
+        "of the binding for the exports.",
+    )
+    step = fields.Integer(readonly=True)
+    record_count = fields.Integer(string="Records", readonly=True)
+    job_uuid = fields.Char(string="Job UUID", readonly=True, copy=False)
+    state = fields.Selection(
+        selection=[
+            ("running", "Running"),
+            ("done", "Done"),
+            ("cancel", "Cancelled"),
+        ],
+        default="running",
+        required=True,
+        readonly=True,
+    )
+    date_done = fields.Datetime(readonly=True)
+
+    @api.model
+    def _spawn(self, backend, model_name, direction, domain=None, force=False):
+        """Create a spawner for the batch import or export of
+        ``model_name`` and delay its first slice"""
+        spawner = self.sudo().create(
+            {
+                "backend_id": backend.id,
+                "model_name": model_name,
+                "direction": direction,
+                "domain": repr(list(domain or [])),
+                "force": force,
+                "max_pending": backend.spawner_max_pending,
+            }
+        )
+        spawner._enqueue()
+        return spawner
+
+    def _enqueue(self, eta=None):
+        """Delay the next slice. The step makes the function string of
+        each slice unique, and the outdated jobs of a spawner harmless."""
+        for spawner in self:
+            spawner.step += 1
+            job = spawner.with_delay(
+                eta=eta,
+                priority=spawner.env[spawner.model_name]._priority,
+                description=_("Spawn the %s jobs of %s")
+                % (spawner.direction, spawner.model_name),
+            ).run_slice(spawner.step)
+            # Without delay, the slice already ran and returned its result
+            spawner.job_uuid = getattr(job, "uuid", False)
+
+    def _count_waiting_jobs(self, channel):
+        return (
+            self.env["queue.job"]
+            .sudo()
+            .search_count(
+                [("channel", "=", channel), ("state", "in", WAITING_JOB_STATES)]
+            )
+        )
+
+    def run_slice(self, step):
+        """Delay the jobs of the next slice of records, as many as the
+        channel of the binding model has free slots"""
+        self.ensure_one()
+        if self.state != "running" or step != self.step:
+            return _("Outdated spawner job, nothing to do.")
+        binding_model = self.env[self.model_name]
+        free = self.max_pending - self._count_waiting_jobs(
+            binding_model._get_channel_name(self.backend_id)
+        )
+        if free <= 0 and self.env.context.get("queue_job__no_delay"):
+            # The jobs run inline, the channel does not fill up
+            free = self.max_pending
+        if free <= 0:
+            self._enqueue(
+                eta=timedelta(seconds=self.backend_id.spawner_poll_interval or 60)
+            )
+            return _("Channel full, next slice delayed.")
+        with self.backend_id.work_on(self.model_name) as work:
+            if self.direction == "import":
+                # A job imports a chunk of records
+                limit = free * (binding_model._chunk_size or 1)
+                spawner = work.component(usage="batch.importer")
+            else:
+                limit = free
+                spawner = work.component(usage="batch.exporter")
+            ids = spawner.run_slice(
+                domain=safe_eval(self.domain),
+                last_id=self.last_id,
+                limit=limit,
+                force=self.force or self.backend_id.force,
+            )
+        vals = {"record_count": self.record_count + len(ids)}
+        if ids:
+            vals["last_id"] = ids[-1]
+        if len(ids) < limit:
+            vals.update({"state": "done", "date_done": fields.Datetime.now()})
+        self.write(vals)
+        if self.state == "running":
+            self._enqueue()
+        _logger.info(
+            "Spawner %s delayed the %s of %s %s records",
+            self.id,
+            self.direction,
+            len(ids),
+            self.model_name,
+        )
+        return _("%s records delayed.") % len(ids)
+
+    def action_cancel(self):
+        self.write({"state": "cancel", "date_done": fields.Datetime.now()})
+
+    @api.model
+    def _cron_resume_spawners(self):
+        """Enqueue again the running spawners which lost their job, after
+        a restart or a failure"""
+        spawners = self.search([("state", "=", "running")])
+        active_uuids = set(
+            self.env["queue.job"]
+            .sudo()
+            .search(
+                [
+                    ("uuid", "in", spawners.mapped("job_uuid")),
+                    (
+                        "state",
+                        "in",
+                        ("pending", "enqueued", "started", "wait_dependencies"),
+                    ),
+                ]
+            )
+            .mapped("uuid")
+        )
+        lost = spawners.filtered(lambda spawner: spawner.job_uuid not in active_uuids)
+        lost._enqueue()
+        return True
+
+    @api.model
+    def _cron_gc_spawners(self, days=7):
+        """Remove the spawners finished more than ``days`` days ago"""
+        limit = fields.Datetime.now() - timedelta(days=days)
+        self.search(
+            [("state", "in", ("done", "cancel")), ("date_done", "<", limit)]
+        ).unlink()
+        return True
@@ -0,0 +1,181 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+import logging
+
+from odoo import api, fields, models
+from psycopg2.extras import Json
+
+_logger = logging.getLogger(__name__)
+
+# A cache hit refreshes the last access of the entry once it is older than
+# this fraction of the TTL
+TOUCH_RATIO = 0.1
+
+
+class OdooRemoteRecordCache(models.Model):
+    """Read-through cache of the records read on the backends.
+
+    The entries are keyed by backend, remote model, remote id and the
+    projection of the read, and are only valid for the remote write date
+    they were read with. The table is UNLOGGED: it is shared by all the
+    workers but not written to the WAL, and it is emptied after a crash.
+
+    The entries are written in short transactions of their own, so the jobs
+    do not hold the locks of the entries until their commit, and keep the
+    records they read when they are rolled back.
+    """
+
+    _name = "odoo.remote.record.cache"
+    _description = "Odoo Remote Record Cache"
+    _auto = False
+    _log_access = False
+    _order = "last_access desc"
+
+    backend_id = fields.Many2one(
+        comodel_name="odoo.backend",
+        string="Odoo Backend",
+        readonly=True,
+    )
+    model = fields.Char(string="Remote Model", readonly=True)
+    res_id = fields.Integer(string="Remote ID", readonly=True)
+    fields_key = fields.Char(readonly=True)
+    remote_write_date = fields.Char(readonly=True)
+    payload = fields.Json(readonly=True)
+    last_access = fields.Datetime(readonly=True)
+
+    def init(self):
+        self.env.cr.execute(
+            """
+            CREATE UNLOGGED TABLE IF NOT EXISTS odoo_remote_record_cache (
+                id SERIAL PRIMARY KEY,
+                backend_id INTEGER NOT NULL
+                    REFERENCES odoo_backend(id) ON DELETE CASCADE,
+                model VARCHAR NOT NULL,
+                res_id INTEGER NOT NULL,
+                fields_key VARCHAR NOT NULL,
+                remote_write_date VARCHAR,
+                payload JSONB NOT NULL,
+                last_access TIMESTAMP NOT NULL
+                    DEFAULT (now() AT TIME ZONE 'UTC')
+            )
+            """
+        )
+        self.env.cr.execute(
+            """
+            CREATE UNIQUE INDEX IF NOT EXISTS odoo_remote_record_cache_key_uniq
+            ON odoo_remote_record_cache (backend_id, model, res_id, fields_key)
+            """
+        )
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS odoo_remote_record_cache_access_idx
+            ON odoo_remote_record_cache (backend_id, last_access)
+            """
+        )
+
+    @api.model
+    def _get_cached(self, backend, model, res_id, fields_key):
+        """Return the remote write date and the payload of the record read
+        with ``fields_key`` if it did not expire, or None.
+
+        The entry is read without lock. Its last access is only refreshed
+        when it is older than a fraction of the TTL, skipping the entry if
+        another transaction holds it, so concurrent hits do not wait.
+        """
+        ttl = backend.remote_cache_ttl
+        self.env.cr.execute(
+            """
+            SELECT id, remote_write_date, payload,
+                last_access < (now() AT TIME ZONE 'UTC') - %s * INTERVAL '1 second'
+            FROM odoo_remote_record_cache
+            WHERE backend_id = %s
+                AND model = %s
+                AND res_id = %s
+                AND fields_key = %s
+                AND last_access > (now() AT TIME ZONE 'UTC') - %s * INTERVAL '1 second'
+            """,
+            (ttl * TOUCH_RATIO, backend.id, model, res_id, fields_key, ttl),
+        )
+        row = self.env.cr.fetchone()
+        if not row:
+            return None
+        entry_id, write_date, payload, stale = row
+        if stale:
+            with self.env.registry.cursor() as cr:
+                cr.execute(
+                    """
+                    UPDATE odoo_remote_record_cache
+                    SET last_access = now() AT TIME ZONE 'UTC'
+                    WHERE id IN (
+                        SELECT id FROM odoo_remote_record_cache
+                        WHERE id = %s
+                        FOR UPDATE SKIP LOCKED
+                    )
+                    """,
+                    (entry_id,),
+                )
+        return write_date, payload
+
+    @api.model
+    def _set_payload(self, backend, model, res_id, fields_key, write_date, payload):
+        """Store a record read on the backend. An existing entry is only
+        rewritten when the write date changed or its last access is old."""
+        with self.env.registry.cursor() as cr:
+            cr.execute(
+                """
+                INSERT INTO odoo_remote_record_cache
+                    (backend_id, model, res_id, fields_key, remote_write_date, payload)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT (backend_id, model, res_id, fields_key) DO UPDATE
+                SET remote_write_date = EXCLUDED.remote_write_date,
+                    payload = EXCLUDED.payload,
+                    last_access = now() AT TIME ZONE 'UTC'
+                WHERE odoo_remote_record_cache.remote_write_date
+                        IS DISTINCT FROM EXCLUDED.remote_write_date
+                    OR odoo_remote_record_cache.last_access
+                        < (now() AT TIME ZONE 'UTC') - %s * INTERVAL '1 second'
+                """,
+                (
+                    backend.id,
+                    model,
+                    res_id,
+                    fields_key,
+                    write_date,
+                    Json(payload),
+                    backend.remote_cache_ttl * TOUCH_RATIO,
+                ),
+            )
+
+    @api.model
+    def _cron_gc_cache(self):
+        """Remove the expired entries, then the least recently used ones
+        above the size limit of each backend"""
+        for backend in self.env["odoo.backend"].search([]):
+            self.env.cr.execute(
+                """
+                DELETE FROM odoo_remote_record_cache
+                WHERE backend_id = %s
+                    AND last_access <= (now() AT TIME ZONE 'UTC')
+                        - %s * INTERVAL '1 second'
+                """,
+                (backend.id, backend.remote_cache_ttl),
+            )
+            expired = self.env.cr.rowcount
+            self.env.cr.execute(
+                """
+                DELETE FROM odoo_remote_record_cache
+                WHERE id IN (
+                    SELECT id FROM odoo_remote_record_cache
+                    WHERE backend_id = %s
+                    ORDER BY last_access DESC
+                    OFFSET %s
+                )
+                """,
+                (backend.id, backend.remote_cache_max_rows),
+            )
+            _logger.info(
+                "Remote record cache of %s: %s expired, %s evicted",
+                backend.name,
+                expired,
+                self.env.cr.rowcount,
+            )
+        return True
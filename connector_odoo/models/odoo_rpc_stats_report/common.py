@@ -0,0 +1,50 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+from odoo import fields, models, tools
+
+
+class OdooRPCStatsReport(models.Model):
+    """Remote calls of the connector jobs, by binding model and method"""
+
+    _name = "odoo.rpc.stats.report"
+    _description = "Odoo Remote Calls Report"
+    _auto = False
+    _order = "call_count desc"
+
+    model_name = fields.Char(string="Binding Model", readonly=True)
+    method_name = fields.Char(string="Job Method", readonly=True)
+    job_count = fields.Integer(string="Jobs", readonly=True)
+    call_count = fields.Integer(string="Remote Calls", readonly=True)
+    avg_call_count = fields.Float(
+        string="Calls per Job", readonly=True, group_operator="avg"
+    )
+    request_bytes = fields.Integer(string="Request Bytes", readonly=True)
+    response_bytes = fields.Integer(string="Response Bytes", readonly=True)
+    duration = fields.Float(string="Remote Call Time (s)", readonly=True)
+    avg_duration = fields.Float(
+        string="Remote Time per Job (s)", readonly=True, group_operator="avg"
+    )
+
+    def init(self):
+        tools.drop_view_if_exists(self.env.cr, self._table)
+        self.env.cr.execute(
+            """
+            CREATE OR REPLACE VIEW {} AS (
+                SELECT
+                    min(id) AS id,
+                    model_name,
+                    method_name,
+                    count(*) AS job_count,
+                    sum(rpc_call_count) AS call_count,
+                    avg(rpc_call_count) AS avg_call_count,
+                    sum(rpc_request_bytes) AS request_bytes,
+                    sum(rpc_response_bytes) AS response_bytes,
+                    sum(rpc_duration) AS duration,
+                    avg(rpc_duration) AS avg_duration
+                FROM queue_job
+                WHERE rpc_call_count > 0
+                GROUP BY model_name, method_name
+            )
+            """.format(
+                self._table
+            )
+        )
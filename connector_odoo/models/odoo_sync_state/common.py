@@ -0,0 +1,166 @@
+# License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+import logging
+from datetime import datetime, timedelta
+
+from odoo import api, fields, models
+
+from odoo.addons.connector_odoo.models.odoo_backend.common import (
+    IMPORT_DELTA_BUFFER,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class OdooSyncState(models.Model):
+    """High watermark of the incremental imports of a binding model.
+
+    The cursor is the (write date, id) pair of the last record imported,
+    the write dates being compared by seconds as they are read from the
+    backend. Each run imports the records strictly after the cursor, up
+    to the last record modified before the run, then moves the cursor to
+    that record: a record is imported once per modification.
+    """
+
+    _name = "odoo.sync.state"
+    _description = "Odoo Synchronization State"
+    _order = "backend_id, model_name"
+
+    backend_id = fields.Many2one(
+        comodel_name="odoo.backend",
+        string="Odoo Backend",
+        required=True,
+        ondelete="cascade",
+    )
+    model_name = fields.Char(string="Binding Model", required=True)
+    last_write_date = fields.Datetime(
+        help="Remote write date of the last record imported, the records "
+        "modified after it are imported by the next run."
+    )
+    last_id = fields.Integer(
+        string="Last ID",
+        help="Remote ID of the last record imported, among the records "
+        "modified at the same second.",
+    )
+    date_sync = fields.Datetime(string="Last Run", readonly=True)
+    date_field = fields.Char(
+        string="Start Date Field",
+        readonly=True,
+        help="Field of the backend the cursor starts from. Changing the date "
+        "of this field moves the cursor back to it.",
+    )
+
+    _sql_constraints = [
+        (
+            "backend_model_uniq",
+            "unique(backend_id, model_name)",
+            "A binding model can only have one synchronization state by backend.",
+        )
+    ]
+
+    @api.model
+    def _get_state(self, backend, model_name, date_field=None):
+        """Return the state of a binding model, created from the date of
+        the ``date_field`` of the backend when it does not exist"""
+        state = self.search(
+            [("backend_id", "=", backend.id), ("model_name", "=", model_name)]
+        )
+        if not state:
+            state = self.create(
+                {
+                    "backend_id": backend.id,
+                    "model_name": model_name,
+                    "last_write_date": date_field and backend[date_field],
+                    "date_field": date_field,
+                }
+            )
+        elif date_field and state.date_field != date_field:
+            state.date_field = date_field
+        return state
+
+    def _restart(self):
+        """Move the cursors back to the date of their start date field"""
+        for state in self.filtered("date_field"):
+            state.write(
+                {
+                    "last_write_date": state.backend_id[state.date_field],
+                    "last_id": 0,
+                }
+            )
+
+    def _get_lower_domain(self):
+        """Domain of the records after the cursor"""
+        self.ensure_one()
+        if not self.last_write_date:
+            return []
+        next_second = fields.Datetime.to_string(
+            self.last_write_date + timedelta(seconds=1)
+        )
+        return [
+            "|",
+            ("write_date", ">=", next_second),
+            "&",
+            ("write_date", ">=", fields.Datetime.to_string(self.last_write_date)),
+            ("id", ">", self.last_id),
+        ]
+
+    @api.model
+    def _get_upper_domain(self, write_date, res_id):
+        """Domain of the records up to the (``write_date``, ``res_id``)
+        cursor, included"""
+        next_second = fields.Datetime.to_string(write_date + timedelta(seconds=1))
+        return [
+            "|",
+            ("write_date", "<", fields.Datetime.to_string(write_date)),
+            "&",
+            ("write_date", "<", next_second),
+            ("id", "<=", res_id),
+        ]
+
+    def _probe_high_watermark(self):
+        """Return the (write date, id) of the last record modified after
+        the cursor, or None when no record changed"""
+        self.ensure_one()
+        # The records modified in the last seconds are left to the next run,
+        # their transaction may not be committed on the backend yet
+        until = datetime.now() - timedelta(seconds=IMPORT_DELTA_BUFFER)
+        with self.backend_id.work_on(self.model_name) as work:
+            adapter = work.component(usage="backend.adapter")
+            records = work.odoo_api.search(
+                model=adapter._odoo_model,
+                domain=self._get_lower_domain()
+                + [("write_date", "<", fields.Datetime.to_string(until))],
+                fields=["write_date"],
+                limit=1,
+                order="write_date desc, id desc",
+                get_passive=adapter._get_passive,
+            )
+        if not records:
+            return None
+        write_date = fields.Datetime.to_datetime(records[0]["write_date"])
+        return write_date.replace(microsecond=0), records[0]["id"]
+
+    def _import_batch(self):
+        """Delay the import of the records modified since the cursor, then
+        move the cursor to the last of them"""
+        self.ensure_one()
+        watermark = self._probe_high_watermark()
+        if not watermark:
+            self.date_sync = fields.Datetime.now()
+            return False
+        domain = self._get_lower_domain() + self._get_upper_domain(*watermark)
+        self.env[self.model_name].delayed_import_batch(self.backend_id, domain)
+        # The cursor is saved with the delayed batch, in the same transaction
+        self.write(
+            {
+                "last_write_date": watermark[0],
+                "last_id": watermark[1],
+                "date_sync": fields.Datetime.now(),
+            }
+        )
+        _logger.info(
+            "Import of %s delayed up to %s (id %s)",
+            self.model_name,
+            watermark[0],
+            watermark[1],
+        )
+        return True
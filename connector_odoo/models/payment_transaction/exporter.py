@@ -56,11 +56,13 @@ class PaymentTransactionExportMapper(Component):
 
     @mapping
     def partner_country_id(self, record):
-        ext_counry = self.work.odoo_api.search(
-            model="res.country",
-            domain=[("code", "=", record.partner_country_id.code)],
-            fields=["id"],
-        )
+        ext_counry = [
+            country
+            for country in self.work.odoo_api.get_reference_records(
+                "res.country"
+            ).values()
+            if country["code"] == record.partner_country_id.code
+        ]
         return {
             "partner_country_id": ext_counry[0]["id"],
         }
@@ -10,22 +10,19 @@ _logger = logging.getLogger(__name__)
 
 
 class ProductAttributeValueBatchImporter(Component):
-
     _name = "odoo.product.attribute.value.batch.importer"
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.product.attribute.value"]
 
     def run(self, domain=None, force=False):
         """Run the synchronization"""
-        external_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo products attribute values %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            job_options = {"priority": 15}
-            self._import_record(external_id, force=force)
 
 
 class ProductAttributeValueImporter(Component):
@@ -35,6 +32,14 @@ class ProductAttributeValueImporter(Component):
     _inherit = "odoo.importer"
     _apply_on = "odoo.product.attribute.value"
 
+    _import_bulk = True
+
+    def _get_natural_key(self):
+        record = self.odoo_record
+        if not record.get("name"):
+            return None
+        return record["attribute_id"][0], record["name"]
+
     def _import_dependencies(self, force=False):
         """Import the dependencies for the record"""
         record = self.odoo_record
@@ -21,14 +21,13 @@ class ProductBrandBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        updated_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo product brands %s returned %s items",
             domain,
-            len(updated_ids),
+            count,
         )
-        for cat in updated_ids:
-            self._import_record(cat, force=force)
 
 
 class ProductBrandImporter(Component):
@@ -15,15 +15,16 @@ class BatchProductCategoryExporter(Component):
     _apply_on = ["odoo.product.category"]
     _usage = "batch.exporter"
 
+    def _get_job_options(self, binding):
+        return dict(
+            super()._get_job_options(binding),
+            max_retries=0,
+            priority=5 + binding.odoo_id.parent_left,
+        )
+
     def run(self, domain=None, force=False):
-        domain += [("backend_id", "=", self.backend_record.id)]
-        prod_ids = self.env["odoo.product.category"].search(domain)
-        for prod in prod_ids:
-            job_options = {
-                "max_retries": 0,
-                "priority": 5 + prod.odoo_id.parent_left,
-            }
-            self._export_record(prod, job_options=job_options)
+        for binding in self.model.search(self._get_batch_domain(domain)):
+            self._export_record(binding)
 
 
 class OdooProductCategoryExporter(Component):
@@ -17,19 +17,19 @@ class ProductImageBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.product.image"]
 
+    _search_model = "base_multi_image.image"
+
     def run(self, domain=None, force=False):
         """Run the synchronization"""
-
-        external_ids = self.backend_adapter.search(
-            domain, model="base_multi_image.image"
+        external_ids = self.backend_adapter.iter_search(
+            domain, model=self._search_model
         )
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo product images %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class ProductImageImportMapper(Component):
@@ -26,14 +26,13 @@ class ProductPricelistBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        updated_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo product pricelist %s returned %s items",
             domain,
-            len(updated_ids),
+            count,
         )
-        for pricelist in updated_ids:
-            self._import_record(pricelist, force=force)
 
 
 class ProductPricelistImporter(Component):
@@ -102,14 +101,13 @@ class ProductPricelistItemBatchImporter(Component):
 
     def run(self, domain=None, force=False):
         """Run the synchronization"""
-        updated_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo product pricelist item %s returned %s items",
             domain,
-            len(updated_ids),
+            count,
         )
-        for pricelist in updated_ids:
-            self._import_record(pricelist, force=force)
 
 
 class ProductPricelistItemImporter(Component):
@@ -162,8 +160,8 @@ class ProductPricelistItemImportMapper(Component):
     def price_type_currency_id(self, record):
         vals = {"price_type_currency_id": 2}
         try:
-            price_type = self.work.odoo_api.browse(
-                model="product.price.type", res_id=int(record["base"])
+            price_type = self.work.odoo_api.get_reference_record(
+                "product.price.type", int(record["base"])
             )
             vals["price_type_currency_id"] = price_type["currency"][0]
         except:
@@ -20,10 +20,12 @@ class BatchProductExporter(Component):
     _apply_on = ["odoo.product.product"]
     _usage = "batch.exporter"
 
-    def run(self, domain=None, force=False):
+    def _get_local_records(self, domain):
         loc_filter = ast.literal_eval(self.backend_record.local_product_domain_filter)
-        domain += loc_filter
-        prod_ids = self.env["product.product"].search(domain)
+        return self.env["product.product"].search(list(domain or []) + loc_filter)
+
+    def _prepare_bindings(self, domain):
+        prod_ids = self._get_local_records(domain)
         o_ids = self.env["odoo.product.product"].search(
             [("backend_id", "=", self.backend_record.id)]
         )
@@ -39,15 +41,20 @@ class BatchProductExporter(Component):
                     "backend_id": self.backend_record.id,
                 }
             )
-        bind_ids = self.env["odoo.product.product"].search(
-            [
-                ("odoo_id", "in", [p.id for p in prod_ids]),
-                ("backend_id", "=", self.backend_record.id),
-            ]
-        )
-        for prod in bind_ids:
-            job_options = {"max_retries": 0}
-            self._export_record(prod, job_options=job_options)
+
+    def _get_batch_domain(self, domain):
+        return [
+            ("odoo_id", "in", self._get_local_records(domain).ids),
+            ("backend_id", "=", self.backend_record.id),
+        ]
+
+    def _get_job_options(self, binding):
+        return dict(super()._get_job_options(binding), max_retries=0)
+
+    def run(self, domain=None, force=False):
+        self._prepare_bindings(domain)
+        for binding in self.model.search(self._get_batch_domain(domain)):
+            self._export_record(binding)
 
 
 class OdooProductExporter(Component):
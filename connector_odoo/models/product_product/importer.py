@@ -6,6 +6,10 @@ import logging
 from odoo.addons.component.core import Component
 from odoo.addons.connector.components.mapper import mapping, only_create
 from odoo.addons.connector.exception import MappingError
+from odoo.addons.connector_odoo.components.mapper import (
+    image_field_name,
+    remote_fields,
+)
 
 _logger = logging.getLogger(__name__)
 
@@ -56,12 +60,9 @@ class ProductBatchImporter(Component):
 
     def run(self, domain=None, force=False):
         """Run the synchronization"""
-        external_ids = self.backend_adapter.search(domain)
-        _logger.info(
-            "search for odoo products %s returned %s items", domain, len(external_ids)
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
+        _logger.info("search for odoo products %s returned %s items", domain, count)
 
 
 class ProductImportMapper(Component):
@@ -84,16 +85,14 @@ class ProductImportMapper(Component):
         ("public_description", "public_description"),
     ]
 
+    @remote_fields("taxes_id")
     @mapping
     def taxes_id(self, record):
         binder = self.binder_for("odoo.account.tax")
-        tax_ids = []
-        for tax_id in record["taxes_id"]:
-            tax = binder.to_internal(tax_id, unwrap=True)
-            if tax:
-                tax_ids.append(tax.id)
-        return {"taxes_id": [(6, 0, tax_ids)]}
+        taxes = binder.to_internal_many(record["taxes_id"], unwrap=True)
+        return {"taxes_id": [(6, 0, taxes.ids)]}
 
+    @remote_fields("id", "product_tmpl_id", "attribute_value_ids")
     @mapping
     def template_and_attributes(self, record):
         """Map template and attributes"""
@@ -138,16 +137,19 @@ class ProductImportMapper(Component):
 
         return vals
 
+    @remote_fields()
     @mapping
     def company_id(self, record):
         return {"company_id": self.env.user.company_id.id}
 
+    @remote_fields("uom_id")
     @mapping
     def uom_id(self, record):
         binder = self.binder_for("odoo.uom.uom")
         uom = binder.to_internal(record["uom_id"][0], unwrap=True)
         return {"uom_id": uom.id, "uom_po_id": uom.id}
 
+    @remote_fields("v_cari_urun")
     @mapping
     def v_cari_urun(self, record):
         vals = {
@@ -159,6 +161,16 @@ class ProductImportMapper(Component):
             vals.update({"v_cari_urun": partner.id})
         return vals
 
+    @remote_fields(
+        "dimensional_uom_id",
+        "product_length",
+        "product_width",
+        "product_height",
+        "weight",
+        "volume",
+        "weight_uom_id",
+        "volume_uom_id",
+    )
     @mapping
     def dimensions(self, record):
         binder = self.binder_for("odoo.uom.uom")
@@ -187,18 +199,22 @@ class ProductImportMapper(Component):
             ),
         }
 
+    @remote_fields("attr_price")
     @mapping
     def price(self, record):
         return {"sale_price": record.get("attr_price", 0.0)}
 
+    @remote_fields("default_code")
     @mapping
     def default_code(self, record):
         return {"default_code": record.get("default_code", "/")}
 
+    @remote_fields("name")
     @mapping
     def name(self, record):
         return {"name": record.get("name", "/")}
 
+    @remote_fields("categ_id")
     @mapping
     def category(self, record):
         categ_id = record["categ_id"]
@@ -210,21 +226,12 @@ class ProductImportMapper(Component):
             )
         return {"categ_id": cat.id}
 
+    @remote_fields(image_field_name)
     @mapping
     def image(self, record):
-        if self.backend_record.version in (
-            "6.1",
-            "7.0",
-            "8.0",
-            "9.0",
-            "10.0",
-            "11.0",
-            "12.0",
-        ):
-            return {"image_1920": record["image_main"]}
-        else:
-            return {"image_1920": record["image_1920"]}
+        return {"image_1920": record[image_field_name(self)]}
 
+    @remote_fields("barcode")
     @mapping
     def barcode(self, record):
         barcode = record.get("barcode") or record.get("ean13")
@@ -236,6 +243,12 @@ class ProductImporter(Component):
     _inherit = "odoo.importer"
     _apply_on = ["odoo.product.product"]
 
+    _dependency_fields = {
+        "product_tmpl_id": "odoo.product.template",
+        "v_cari_urun": "odoo.res.partner",
+        "attribute_value_ids": "odoo.product.attribute.value",
+    }
+
     def _must_skip(self):
         """If the product is not active and won't be active, we skip it"""
         binding = self.model.search(
@@ -279,6 +292,7 @@ class ProductImporter(Component):
             self._import_dependency(partner_id, "odoo.res.partner", force=force)
 
         if attr_vals := self.odoo_record["attribute_value_ids"]:
+            self._prefetch_write_dates("odoo.product.attribute.value", attr_vals)
             for attr_val_id in attr_vals:
                 self._import_dependency(
                     attr_val_id, "odoo.product.attribute.value", force=force
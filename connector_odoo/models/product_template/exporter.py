@@ -20,11 +20,12 @@ class BatchProductTemplateExporter(Component):
     _apply_on = ["odoo.product.template"]
     _usage = "batch.exporter"
 
-    def run(self, domain=None, force=False):
+    def _get_local_records(self, domain):
         loc_filter = ast.literal_eval(self.backend_record.local_product_domain_filter)
-        domain += loc_filter
-        prod_ids = self.env["product.template"].search(domain)
+        return self.env["product.template"].search(list(domain or []) + loc_filter)
 
+    def _prepare_bindings(self, domain):
+        prod_ids = self._get_local_records(domain)
         o_ids = self.env["odoo.product.template"].search(
             [("backend_id", "=", self.backend_record.id)]
         )
@@ -32,7 +33,6 @@ class BatchProductTemplateExporter(Component):
             [("id", "in", [o.odoo_id.id for o in o_ids])]
         )
         to_bind = prod_ids - o_prod_ids
-
         for p in to_bind:
             self.env["odoo.product.template"].create(
                 {
@@ -42,17 +42,19 @@ class BatchProductTemplateExporter(Component):
                 }
             )
 
-        bind_ids = self.env["odoo.product.template"].search(
-            [
-                ("odoo_id", "in", [p.id for p in prod_ids]),
-                ("backend_id", "=", self.backend_record.id),
-            ]
-        )
-        for prod in bind_ids:
-            job_options = {
-                "max_retries": 0,
-            }
-            self._export_record(prod, job_options=job_options)
+    def _get_batch_domain(self, domain):
+        return [
+            ("odoo_id", "in", self._get_local_records(domain).ids),
+            ("backend_id", "=", self.backend_record.id),
+        ]
+
+    def _get_job_options(self, binding):
+        return dict(super()._get_job_options(binding), max_retries=0)
+
+    def run(self, domain=None, force=False):
+        self._prepare_bindings(domain)
+        for binding in self.model.search(self._get_batch_domain(domain)):
+            self._export_record(binding)
 
 
 class OdooProductTemplateExporter(Component):
@@ -61,7 +63,6 @@ class OdooProductTemplateExporter(Component):
     _apply_on = ["odoo.product.template"]
 
     def _export_dependencies(self):
-
         categ_ids = self.binding.categ_id.bind_ids
         categ_id = self.env["odoo.product.category"]
 
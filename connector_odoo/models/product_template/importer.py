@@ -7,6 +7,10 @@ import logging
 from odoo.addons.component.core import Component
 from odoo.addons.connector.components.mapper import mapping
 from odoo.addons.connector.exception import MappingError
+from odoo.addons.connector_odoo.components.mapper import (
+    image_field_name,
+    remote_fields,
+)
 from lxml.html.clean import Cleaner
 
 _logger = logging.getLogger(__name__)
@@ -26,15 +30,13 @@ class ProductTemplateBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        external_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo products template %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            job_options = {"priority": 15}
-            self._import_record(external_id, force=force)
 
 
 class ProductTemplateImportMapper(Component):
@@ -60,6 +62,16 @@ class ProductTemplateImportMapper(Component):
         # ("public_description", "public_description"),
     ]
 
+    @remote_fields(
+        "dimensional_uom_id",
+        "product_length",
+        "product_width",
+        "product_height",
+        "weight",
+        "volume",
+        "weight_uom_id",
+        "volume_uom_id",
+    )
     @mapping
     def dimensions(self, record):
         binder = self.binder_for("odoo.uom.uom")
@@ -88,20 +100,19 @@ class ProductTemplateImportMapper(Component):
             ),
         }
 
+    @remote_fields("taxes_id")
     @mapping
     def taxes_id(self, record):
         binder = self.binder_for("odoo.account.tax")
-        tax_ids = []
-        for tax_id in record["taxes_id"]:
-            tax = binder.to_internal(tax_id, unwrap=True)
-            if tax:
-                tax_ids.append(tax.id)
-        return {"taxes_id": [(6, 0, tax_ids)]}
+        taxes = binder.to_internal_many(record["taxes_id"], unwrap=True)
+        return {"taxes_id": [(6, 0, taxes.ids)]}
 
+    @remote_fields()
     @mapping
     def company_id(self, record):
         return {"company_id": self.env.user.company_id.id}
 
+    @remote_fields("product_brand_id")
     @mapping
     def product_brand_id(self, record):
         if product_brand_id := record.get("product_brand_id"):
@@ -110,20 +121,24 @@ class ProductTemplateImportMapper(Component):
             return {"product_brand_id": brand.id}
         return {"product_brand_id": False}
 
+    @remote_fields("uom_id")
     @mapping
     def uom_id(self, record):
         binder = self.binder_for("odoo.uom.uom")
         uom = binder.to_internal(record["uom_id"][0], unwrap=True)
         return {"uom_id": uom.id, "uom_po_id": uom.id}
 
+    @remote_fields("default_code")
     @mapping
     def default_code(self, record):
         return {"default_code": record.get("default_code", "/")}
 
+    @remote_fields("name")
     @mapping
     def name(self, record):
         return {"name": record.get("name", "/")}
 
+    @remote_fields("categ_id")
     @mapping
     def category(self, record):
         """This method is used to map the category of the product,
@@ -149,21 +164,12 @@ class ProductTemplateImportMapper(Component):
 
         return vals
 
+    @remote_fields(image_field_name)
     @mapping
     def image(self, record):
-        if self.backend_record.version in (
-            "6.1",
-            "7.0",
-            "8.0",
-            "9.0",
-            "10.0",
-            "11.0",
-            "12.0",
-        ):
-            return {"image_1920": record["image_main"]}
-        else:
-            return {"image_1920": record["image_1920"]}
+        return {"image_1920": record[image_field_name(self)]}
 
+    @remote_fields("public_description")
     @mapping
     def public_description(self, record):
         """Sometimes user can edit HTML field with JS editor.
@@ -177,6 +183,7 @@ class ProductTemplateImportMapper(Component):
             vals["public_description"] = cleaner.clean_html(desc) or ""
         return vals
 
+    @remote_fields("default_variant_id")
     @mapping
     def default_variant_id(self, record):
         vals = {}
@@ -197,6 +204,19 @@ class ProductTemplateImporter(Component):
     _inherit = "odoo.importer"
     _apply_on = ["odoo.product.template"]
 
+    _dependency_fields = {
+        "uom_id": "odoo.uom.uom",
+        "categ_id": "odoo.product.category",
+        "product_brand_id": "odoo.product.brand",
+    }
+
+    _extra_read_fields = [
+        "attribute_line_ids",
+        "feature_line_ids",
+        "website_attachment_ids",
+        "accessory_product_ids",
+    ]
+
     def _import_dependencies(self, force=False):
         """Import the dependencies for the record"""
         self._import_dependency(
@@ -277,6 +297,8 @@ class ProductTemplateImporter(Component):
 
     def _import_product_accessories(self, tmpl_id, force=False):
         if accessory_ids := self.odoo_record["accessory_product_ids"]:
+            if not force:
+                self._prefetch_write_dates("odoo.product.product", accessory_ids)
             for product_id in accessory_ids:
                 self._import_dependency(
                     product_id,
@@ -29,15 +29,13 @@ class PurchaseOrderBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        updated_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo purchase orders %s returned %s items",
             domain,
-            len(updated_ids),
+            count,
         )
-        for order in updated_ids:
-            order_id = self.backend_adapter.read(order)
-            self._import_record(order_id.id, force=force)
 
 
 class PurchaseOrderImporter(Component):
@@ -179,21 +177,18 @@ class PurchaseOrderLineBatchImporter(Component):
     _inherit = "odoo.delayed.batch.importer"
     _apply_on = ["odoo.purchase.order.item"]
 
+    def _get_job_options(self):
+        return dict(super()._get_job_options(), priority=10)
+
     def run(self, domain=None, force=False):
         """Run the synchronization"""
-
-        updated_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo purchase orders %s returned %s items",
             domain,
-            len(updated_ids),
+            count,
         )
-        for order in updated_ids:
-            order_id = self.backend_adapter.read(order)
-            job_options = {
-                "priority": 10,
-            }
-            self._import_record(order_id.id, job_options=job_options, force=force)
 
 
 class PurchaseOrderLineImporter(Component):
@@ -1,7 +1,14 @@
 # Copyright 2023 Yiğit Budak (https://github.com/yibudak)
 # License AGPL-3.0 or later (http://www.gnu.org/licenses/agpl)
+import json
+from hashlib import md5
+
 from odoo import models, fields, api, _
 
+# States of the jobs which can still run, a job is a duplicate of a job in
+# one of these states
+ACTIVE_JOB_STATES = ("pending", "enqueued", "started")
+
 
 class JobQueue(models.Model):
     _inherit = "queue.job"
@@ -17,6 +24,37 @@ class JobQueue(models.Model):
         readonly=True,
     )
 
+    rpc_call_count = fields.Integer(
+        string="Remote Calls",
+        help="Number of JSON-RPC calls made by the job.",
+        readonly=True,
+    )
+    rpc_request_bytes = fields.Integer(
+        string="Remote Request Bytes",
+        readonly=True,
+    )
+    rpc_response_bytes = fields.Integer(
+        string="Remote Response Bytes",
+        readonly=True,
+    )
+    rpc_duration = fields.Float(
+        string="Remote Call Time (s)",
+        help="Time spent waiting for the remote calls of the job.",
+        readonly=True,
+    )
+    rpc_details = fields.Text(
+        string="Remote Calls Details",
+        help="Remote calls of the job by model and method.",
+        readonly=True,
+    )
+
+    odoo_fingerprint = fields.Char(
+        string="Odoo Job Fingerprint",
+        help="Hash of the channel and of the function of a connector job, "
+        "the jobs with the same fingerprint do the same thing.",
+        readonly=True,
+        copy=False,
+    )
     duplicate = fields.Boolean(
         string="Duplicate",
         help="If this job is a duplicate of another job, this field is True.",
@@ -24,15 +62,70 @@ class JobQueue(models.Model):
         compute="_compute_duplicate",
     )
 
+    def init(self):
+        # Fingerprint the jobs created before the field, with the same hash
+        # as _get_odoo_fingerprint
+        self.env.cr.execute(
+            """
+            UPDATE queue_job
+            SET odoo_fingerprint = md5(
+                coalesce(channel, '') || '|' || func_string
+            )
+            WHERE odoo_fingerprint IS NULL
+                AND model_name LIKE 'odoo.%%'
+                AND func_string IS NOT NULL
+                AND state IN %s
+            """,
+            (ACTIVE_JOB_STATES,),
+        )
+        # Only the jobs which can still run are looked up by fingerprint
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS queue_job_odoo_fingerprint_active_idx
+            ON queue_job (odoo_fingerprint)
+            WHERE odoo_fingerprint IS NOT NULL
+                AND state IN %s
+            """,
+            (ACTIVE_JOB_STATES,),
+        )
+
+    @api.model
+    def _get_odoo_fingerprint(self, vals):
+        """Return the fingerprint of a job of the connector from its create
+        values. The function string holds the binding model, the method,
+        the backend and the arguments such as the external id and the
+        force flag."""
+        model_name = vals.get("model_name") or ""
+        if not model_name.startswith("odoo.") or not vals.get("func_string"):
+            return False
+        key = "{}|{}".format(vals.get("channel") or "", vals["func_string"])
+        return md5(key.encode()).hexdigest()
+
+    @api.model
+    def _get_active_fingerprints(self, fingerprints):
+        """Return the fingerprints of ``fingerprints`` which belong to a
+        job which can still run, with one lookup of the partial index"""
+        if not fingerprints:
+            return set()
+        self.flush_model(["odoo_fingerprint", "state"])
+        self.env.cr.execute(
+            """
+            SELECT DISTINCT odoo_fingerprint
+            FROM queue_job
+            WHERE odoo_fingerprint IN %s
+                AND odoo_fingerprint IS NOT NULL
+                AND state IN %s
+            """,
+            (tuple(fingerprints), ACTIVE_JOB_STATES),
+        )
+        return {row[0] for row in self.env.cr.fetchall()}
+
     def _compute_duplicate(self):
         for record in self:
-            duplicate_job = self.search(
+            duplicate_job = record.odoo_fingerprint and self.search(
                 [
-                    ("func_string", "=", record.func_string),
-                    ("state", "in", ("pending", "enqueued", "started")),
-                    ("model_name", "=", record.model_name),
-                    ("model_name", "=like", "odoo.%"),
-                    ("channel", "=", record.channel),
+                    ("odoo_fingerprint", "=", record.odoo_fingerprint),
+                    ("state", "in", ACTIVE_JOB_STATES),
                     ("id", "!=", record.id),
                 ],
                 limit=1,
@@ -45,11 +138,44 @@ class JobQueue(models.Model):
         """
         Override the create method to set the state of the duplicate jobs to "done".
         """
-        res = super(JobQueue, self).create(vals_list)
-        for record in res:
-            if record.duplicate:
-                record.state = "done"
-                record.result = "Duplicate job automatically marked as done."
+        for vals in vals_list:
+            vals["odoo_fingerprint"] = self._get_odoo_fingerprint(vals)
+        seen = self._get_active_fingerprints(
+            {vals["odoo_fingerprint"] for vals in vals_list if vals["odoo_fingerprint"]}
+        )
+        for vals in vals_list:
+            fingerprint = vals["odoo_fingerprint"]
+            if not fingerprint or vals.get("state", "pending") not in ACTIVE_JOB_STATES:
+                continue
+            if fingerprint in seen:
+                vals.update(
+                    {
+                        "state": "done",
+                        "date_done": fields.Datetime.now(),
+                        "result": "Duplicate job automatically marked as done.",
+                    }
+                )
+            seen.add(fingerprint)
+        return super(JobQueue, self).create(vals_list)
+
+    @api.model
+    def _store_rpc_stats(self, job_uuid, stats):
+        """Attach the remote calls collected while running a job to it"""
+        if not (job_uuid and stats.calls):
+            return False
+        job = self.sudo().search([("uuid", "=", job_uuid)], limit=1)
+        if not job:
+            return False
+        job.write(
+            {
+                "rpc_call_count": stats.total("count"),
+                "rpc_request_bytes": stats.total("request_bytes"),
+                "rpc_response_bytes": stats.total("response_bytes"),
+                "rpc_duration": stats.total("duration"),
+                "rpc_details": json.dumps(stats.calls, indent=2, sort_keys=True),
+            }
+        )
+        return True
 
     def run_next_job(self):
         """
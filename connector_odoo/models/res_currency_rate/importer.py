@@ -17,15 +17,13 @@ class ResCurrencyRateBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        external_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo currency rates %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        base_priority = 10
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class ResCurrencyRateMapper(Component):
@@ -72,6 +70,12 @@ class CurrencyRateImporter(Component):
     _inherit = "odoo.importer"
     _apply_on = "odoo.res.currency.rate"
 
+    _import_bulk = True
+
+    def _get_natural_key(self):
+        record = self.odoo_record
+        return record["name"], record["currency_id"][0]
+
     def _import_dependencies(self, force=False):
         self._import_dependency(
             self.odoo_record["currency_id"][0],
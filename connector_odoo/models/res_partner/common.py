@@ -15,6 +15,7 @@ _logger = logging.getLogger(__name__)
 class OdooPartner(models.Model):
     _special_channel = "root.2"
     _queue_priority = 3
+    _import_chunk_size = 50
     _name = "odoo.res.partner"
     _inherit = "odoo.binding"
     _inherits = {"res.partner": "odoo_id"}
@@ -67,7 +68,11 @@ class Partner(models.Model):
             binding = bindings[0]
             with binding.backend_id.work_on("odoo.res.partner") as work:
                 adapter = work.component(usage="record.importer").backend_adapter
-                data = adapter.read(binding.external_id, context=context)
+                data = adapter.read(
+                    binding.external_id,
+                    context=context,
+                    fields=["risk_currency_id", "risk_total", "credit_limit"],
+                )
                 res[partner.id] = {
                     "risk_currency_id": data.get("risk_currency_id", 0),
                     "risk_total": data.get("risk_total", 0),
@@ -20,11 +20,12 @@ class BatchPartnerExporter(Component):
     _apply_on = ["odoo.res.partner"]
     _usage = "batch.exporter"
 
-    def run(self, domain=None, force=False):
+    def _get_local_records(self, domain):
         loc_filter = ast.literal_eval(self.backend_record.local_partner_domain_filter)
-        domain += loc_filter
-        partner_ids = self.env["res.partner"].search(domain)
+        return self.env["res.partner"].search(list(domain or []) + loc_filter)
 
+    def _prepare_bindings(self, domain):
+        partner_ids = self._get_local_records(domain)
         o_ids = self.env["odoo.res.partner"].search(
             [("backend_id", "=", self.backend_record.id)]
         )
@@ -32,7 +33,6 @@ class BatchPartnerExporter(Component):
             [("id", "in", [o.odoo_id.id for o in o_ids])]
         )
         to_bind = partner_ids - o_partner_ids
-
         for p in to_bind:
             self.env["odoo.res.partner"].create(
                 {
@@ -42,15 +42,19 @@ class BatchPartnerExporter(Component):
                 }
             )
 
-        bind_ids = self.env["odoo.res.partner"].search(
-            [
-                ("odoo_id", "in", [p.id for p in partner_ids]),
-                ("backend_id", "=", self.backend_record.id),
-            ]
-        )
-        for partner in bind_ids:
-            job_options = {"max_retries": 0}
-            self._export_record(partner, job_options=job_options)
+    def _get_batch_domain(self, domain):
+        return [
+            ("odoo_id", "in", self._get_local_records(domain).ids),
+            ("backend_id", "=", self.backend_record.id),
+        ]
+
+    def _get_job_options(self, binding):
+        return dict(super()._get_job_options(binding), max_retries=0)
+
+    def run(self, domain=None, force=False):
+        self._prepare_bindings(domain)
+        for binding in self.model.search(self._get_batch_domain(domain)):
+            self._export_record(binding)
 
 
 class OdooPartnerExporter(Component):
@@ -144,7 +148,6 @@ class OdooPartnerExporter(Component):
             limit=1,
         )
         if external_company:
-
             external_company = self.work.odoo_api.browse(
                 model="res.partner",
                 res_id=external_company[0],
@@ -7,6 +7,7 @@ import secrets
 import string
 from odoo.addons.component.core import Component
 from odoo.addons.connector.components.mapper import mapping, only_create
+from odoo.addons.connector_odoo.components.mapper import remote_fields
 
 _logger = logging.getLogger(__name__)
 
@@ -24,12 +25,9 @@ class PartnerBatchImporter(Component):
 
     def run(self, domain=None, force=False):
         """Run the synchronization"""
-        external_ids = self.backend_adapter.search(domain)
-        _logger.debug(
-            "search for odoo partner %s returned %s items", domain, len(external_ids)
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
+        _logger.debug("search for odoo partner %s returned %s items", domain, count)
 
 
 class PartnerImportMapper(Component):
@@ -60,6 +58,7 @@ class PartnerImportMapper(Component):
         ("website_privacy_level", "website_privacy_level"),
     ]
 
+    @remote_fields("active", "email")
     @mapping
     def active(self, record):
         active = record.get("active", False)
@@ -71,6 +70,7 @@ class PartnerImportMapper(Component):
                 active = True
         return {"active": active}
 
+    @remote_fields("property_product_pricelist", "website_pricelist_id")
     @mapping
     def pricelist_id(self, record):
         vals = {
@@ -90,6 +90,7 @@ class PartnerImportMapper(Component):
 
         return vals
 
+    @remote_fields("id", "name", "vat")
     @only_create
     @mapping
     def check_res_partner_exists(self, record):
@@ -114,6 +115,7 @@ class PartnerImportMapper(Component):
             vals.update({"odoo_id": odoo_partner_id.odoo_id.id})
         return vals
 
+    @remote_fields("neighbour_id")
     @mapping
     def address_fields(self, record):
         vals = {
@@ -133,6 +135,7 @@ class PartnerImportMapper(Component):
                 vals["state_id"] = local_neighbour.region_id.district_id.state_id.id
         return vals
 
+    @remote_fields("email")
     @mapping
     def email(self, record):
         """Get the first email address"""
@@ -141,6 +144,7 @@ class PartnerImportMapper(Component):
             vals["email"] = record["email"].split(",")[0]
         return vals
 
+    @remote_fields("country_id")
     @mapping
     def country_id(self, record):
         vals = {"country_id": False}
@@ -148,14 +152,15 @@ class PartnerImportMapper(Component):
             vals["country_id"] = country_id[0]
         return vals
 
+    @remote_fields("state_id")
     @mapping
     def state_id(self, record):
         vals = {"state_id": False}
         if not record.get("state_id"):
             return vals
         else:
-            external_state_id = self.work.odoo_api.browse(
-                model="res.country.state", res_id=record["state_id"][0]
+            external_state_id = self.work.odoo_api.get_reference_record(
+                "res.country.state", record["state_id"][0]
             )
 
             local_state_id = self.env["res.country.state"].search(
@@ -168,6 +173,7 @@ class PartnerImportMapper(Component):
                 vals["state_id"] = local_state_id.id
         return vals
 
+    @remote_fields("parent_id")
     @mapping
     def parent_id(self, record):
         vals = {"parent_id": False}
@@ -178,6 +184,7 @@ class PartnerImportMapper(Component):
             ).id
         return vals
 
+    @remote_fields("property_account_receivable_id")
     @mapping
     def property_account_receivable(self, record):
         vals = {"property_account_receivable_id": False}
@@ -188,6 +195,7 @@ class PartnerImportMapper(Component):
                 vals["property_account_receivable_id"] = local_account.id
         return vals
 
+    @remote_fields("property_account_payable_id")
     @mapping
     def property_account_payable(self, record):
         vals = {"property_account_payable_id": False}
@@ -198,6 +206,7 @@ class PartnerImportMapper(Component):
                 vals["property_account_payable_id"] = local_account.id
         return vals
 
+    @remote_fields("property_payment_term_id")
     @mapping
     def property_payment_term(self, record):
         vals = {"property_payment_term_id": False}
@@ -208,6 +217,7 @@ class PartnerImportMapper(Component):
                 vals["property_payment_term_id"] = local_payment_term.id
         return vals
 
+    @remote_fields("property_account_position_id")
     @mapping
     def property_account_position(self, record):
         vals = {"property_account_position_id": False}
@@ -218,6 +228,7 @@ class PartnerImportMapper(Component):
                 vals["property_account_position_id"] = local_position.id
         return vals
 
+    @remote_fields("campaign_id", "medium_id", "source_id")
     @mapping
     def utm(self, record):
         vals = {
@@ -248,6 +259,16 @@ class PartnerImporter(Component):
     _inherit = "odoo.importer"
     _apply_on = ["odoo.res.partner"]
 
+    _dependency_fields = {
+        "parent_id": "odoo.res.partner",
+        "property_account_payable_id": "odoo.account.account",
+        "property_account_receivable_id": "odoo.account.account",
+        "property_payment_term_id": "odoo.account.payment.term",
+        "property_account_position_id": "odoo.account.fiscal.position",
+        "property_product_pricelist": "odoo.product.pricelist",
+        "website_pricelist_id": "odoo.product.pricelist",
+    }
+
     def _get_context(self):
         ctx = super(PartnerImporter, self)._get_context()
         ctx["no_vat_validation"] = True
@@ -23,8 +23,7 @@ class SaleOrderBatchImporter(Component):
     _apply_on = ["odoo.sale.order"]
     _usage = "batch.importer"
 
-    def run(self, domain=None, force=False):
-        """Run the synchronization"""
+    def _get_batch_domain(self, domain):
         # exported_ids = self.model.search([("external_id", "!=", 0)]).mapped(
         #     "external_id"
         # )
@@ -32,15 +31,20 @@ class SaleOrderBatchImporter(Component):
         synced_partner_ext_ids = (
             self.env["odoo.res.partner"].search([]).mapped("external_id")
         )
-        domain += [("partner_id", "in", synced_partner_ext_ids)]
-        updated_ids = self.backend_adapter.search(domain)
+        return super()._get_batch_domain(domain) + [
+            ("partner_id", "in", synced_partner_ext_ids)
+        ]
+
+    def run(self, domain=None, force=False):
+        """Run the synchronization"""
+        domain = self._get_batch_domain(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo sale orders %s returned %s items",
             domain,
-            len(updated_ids),
+            count,
         )
-        for order_id in updated_ids:
-            self._import_record(order_id, force=force)
 
 
 class SaleOrderImportMapper(Component):
@@ -180,6 +184,8 @@ class SaleOrderImporter(Component):
                 self.odoo_record["partner_invoice_id"][0],
             }
         )
+        if not force:
+            self._prefetch_write_dates("odoo.res.partner", partner_ids)
         for partner_id in partner_ids:
             self._import_dependency(
                 partner_id,
@@ -205,6 +211,10 @@ class SaleOrderImporter(Component):
         res = super()._after_import(binding, force)
         # Update the sale order lines
         if self.odoo_record["order_line"]:
+            if not force:
+                self._prefetch_write_dates(
+                    "odoo.sale.order.line", self.odoo_record["order_line"]
+                )
             for line_id in self.odoo_record["order_line"]:
                 self._import_dependency(
                     line_id,
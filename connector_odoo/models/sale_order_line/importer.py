@@ -22,15 +22,13 @@ class SaleOrderLineBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        updated_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo sale orders %s returned %s items",
             domain,
-            len(updated_ids),
+            count,
         )
-        for order in updated_ids:
-            order_id = self.backend_adapter.read(order)
-            self._import_record(order_id.id, force=force)
 
 
 class SaleOrderLineImportMapper(Component):
@@ -16,15 +16,13 @@ class StockMoveBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        updated_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo stock move %s returned %s items",
             domain,
-            len(updated_ids),
+            count,
         )
-        for move in updated_ids:
-            move_id = self.backend_adapter.read(move)
-            self._import_record(move_id.id, force=force)
 
 
 class StockMoveImporter(Component):
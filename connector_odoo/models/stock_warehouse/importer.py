@@ -19,16 +19,15 @@ class StockWarehouseBatchImporter(Component):
 
     def run(self, domain=None, force=False):
         """Run the synchronization"""
-        external_ids = self.backend_adapter.search(
+        external_ids = self.backend_adapter.iter_search(
             domain,
         )
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo Warehouse %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class StockWarehouseImporter(Component):
@@ -9,6 +9,7 @@ from odoo.addons.component.core import Component
 
 class OdooProductUOM(models.Model):
     _queue_priority = 10
+    _import_chunk_size = 200
     _name = "odoo.uom.uom"
     _inherit = [
         "odoo.binding",
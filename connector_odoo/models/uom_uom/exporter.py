@@ -16,19 +16,14 @@ class BatchUomExporter(Component):
     _apply_on = ["odoo.uom.uom"]
     _usage = "batch.exporter"
 
-    def run(self, domain=None, force=False):
+    def _get_local_records(self, domain):
         loc_filter = safe_eval(self.backend_record.local_uom_uom_domain_filter)
-        domain += loc_filter
-        uoms = self.env["uom.uom"].search(domain)
+        return self.env["uom.uom"].search(list(domain or []) + loc_filter)
+
+    def _prepare_bindings(self, domain):
+        uoms = self._get_local_records(domain)
         o_ids = self.env["odoo.uom.uom"].search(
-            [
-                ("backend_id", "=", self.backend_record.id),
-            ]
-        )
-        _logger.info(
-            "search for odoo UoM %s returned %s items",
-            domain,
-            len(o_ids),
+            [("backend_id", "=", self.backend_record.id)]
         )
         o_uoms = self.env["uom.uom"].search(
             [("id", "in", [o.odoo_id.id for o in o_ids])]
@@ -42,14 +37,20 @@ class BatchUomExporter(Component):
                     "backend_id": self.backend_record.id,
                 }
             )
-        bind_ids = self.env["odoo.uom.uom"].search(
-            [("odoo_id", "in", uoms.ids), ("backend_id", "=", self.backend_record.id)]
-        )
-        for uom in bind_ids:
-            job_options = {
-                "max_retries": 0,
-            }
-            self._export_record(uom, force=force)
+
+    def _get_batch_domain(self, domain):
+        return [
+            ("odoo_id", "in", self._get_local_records(domain).ids),
+            ("backend_id", "=", self.backend_record.id),
+        ]
+
+    def _get_job_options(self, binding):
+        return dict(super()._get_job_options(binding), max_retries=0)
+
+    def run(self, domain=None, force=False):
+        self._prepare_bindings(domain)
+        for binding in self.model.search(self._get_batch_domain(domain)):
+            self._export_record(binding)
 
 
 class OdooUomExporter(Component):
@@ -19,14 +19,11 @@ class UomBatchImporter(Component):
 
     def run(self, domain=None, force=False):
         """Run the synchronization"""
-        external_ids = self.backend_adapter.search(
+        external_ids = self.backend_adapter.iter_search(
             domain,
         )
-        _logger.info(
-            "search for odoo uom %s returned %s items", domain, len(external_ids)
-        )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
+        count = self._import_records(external_ids, force=force)
+        _logger.info("search for odoo uom %s returned %s items", domain, count)
 
 
 class UomMapper(Component):
@@ -90,3 +87,9 @@ class UoMImporter(Component):
     _name = "odoo.uom.uom.importer"
     _inherit = "odoo.importer"
     _apply_on = "odoo.uom.uom"
+
+    _import_bulk = True
+
+    def _get_natural_key(self):
+        record = self.odoo_record
+        return record["name"], record["category_id"][1]
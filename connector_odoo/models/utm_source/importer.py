@@ -17,14 +17,13 @@ class UTMSourceBatchImporter(Component):
     def run(self, domain=None, force=False):
         """Run the synchronization"""
 
-        external_ids = self.backend_adapter.search(domain)
+        external_ids = self.backend_adapter.iter_search(domain)
+        count = self._import_records(external_ids, force=force)
         _logger.info(
             "search for odoo utm source %s returned %s items",
             domain,
-            len(external_ids),
+            count,
         )
-        for external_id in external_ids:
-            self._import_record(external_id, force=force)
 
 
 class UTMSourceMapper(Component):
@@ -49,20 +48,26 @@ class UTMSourceMapper(Component):
 
 
 class UTMSourceImporter(Component):
-
     _name = "odoo.utm.source.importer"
     _inherit = "odoo.importer"
     _apply_on = "odoo.utm.source"
 
-    def _create(self, data):
+    _import_bulk = True
+
+    def _get_natural_key(self):
+        return self.odoo_record["name"]
+
+    # pylint: disable=W8121
+    def _create_data(self, map_record, **kwargs):
         """
         When creating new binding, if there is any odoo_id, we should remove all the
         keys and just keep the odoo_id key. So it means we would create a new binding
         for the odoo_id.
         """
+        data = super(UTMSourceImporter, self)._create_data(map_record, **kwargs)
         if data.get("odoo_id"):
             data = {
                 "odoo_id": data["odoo_id"],
                 "backend_id": self.backend_record.id,
             }
-        return super(UTMSourceImporter, self)._create(data)
+        return data
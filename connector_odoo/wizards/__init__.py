@@ -1,3 +1,4 @@
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 from . import import_single_field_legacy
 from . import import_external_id
+from . import channel_allocation
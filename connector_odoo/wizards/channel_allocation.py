@@ -0,0 +1,214 @@
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+import math
+from datetime import timedelta
+
+from odoo import _, api, fields, models
+
+# Models with a priority up to this one are latency sensitive: they get
+# channels of their own, away from the heavy models
+LATENCY_SENSITIVE_PRIORITY = 2
+
+# Proposed capacities leave this margin over the measured utilisation
+CAPACITY_HEADROOM = 1.5
+
+
+class OdooChannelAllocation(models.TransientModel):
+    """Place the binding models into the job channels from their measured
+    load, and propose the capacities of the channels.
+
+    The load of a model is the execution time of its jobs on the backend
+    during the period, plus the estimated time of its waiting jobs. The
+    latency sensitive models get a channel each, the other ones are packed
+    into the remaining channels, the heaviest first, each one into the
+    channel with the lowest load.
+    """
+
+    _name = "odoo.channel.allocation.wizard"
+    _description = "Odoo Job Channel Allocation"
+
+    def _get_default_backend(self):
+        return self.env["odoo.backend"].search([], limit=1).id
+
+    backend_id = fields.Many2one(
+        "odoo.backend", required=True, default=_get_default_backend
+    )
+    days = fields.Integer(
+        string="Period (days)",
+        default=7,
+        required=True,
+        help="The jobs of this number of last days are measured.",
+    )
+    channel_count = fields.Integer(
+        string="Channels",
+        default=10,
+        required=True,
+        help="Number of channels, named root.0 to root.N-1.",
+    )
+    line_ids = fields.One2many(
+        "odoo.channel.allocation.line", "wizard_id", string="Binding Models"
+    )
+    channel_config = fields.Text(
+        string="Channel Capacities",
+        readonly=True,
+        help="Proposed value of the channels option of the jobrunner.",
+    )
+
+    def _get_model_loads(self):
+        """Return the job statistics of the binding models for the
+        backend. The jobs of a backend are the ones having it in their
+        arguments, as the import and export jobs do."""
+        self.ensure_one()
+        self.env["queue.job"].flush_model()
+        date_from = fields.Datetime.now() - timedelta(days=self.days)
+        self.env.cr.execute(
+            """
+            SELECT
+                model_name,
+                count(*) FILTER (WHERE state IN ('done', 'failed')),
+                coalesce(avg(exec_time) FILTER (WHERE state = 'done'), 0),
+                coalesce(sum(exec_time) FILTER (WHERE state IN ('done', 'failed')), 0),
+                count(*) FILTER (WHERE state IN ('pending', 'enqueued'))
+            FROM queue_job
+            WHERE model_name LIKE 'odoo.%%'
+                AND func_string LIKE %s
+                AND (date_created >= %s OR state IN ('pending', 'enqueued'))
+            GROUP BY model_name
+            """,
+            ("%{!r}%".format(self.backend_id), date_from),
+        )
+        loads = {}
+        for model_name, count, avg, total, pending in self.env.cr.fetchall():
+            if model_name not in self.env or not hasattr(
+                self.env[model_name], "_get_channel_name"
+            ):
+                continue
+            loads[model_name] = {
+                "job_count": count,
+                "avg_duration": avg,
+                "total_duration": total,
+                "pending_count": pending,
+                "load": total + pending * avg,
+            }
+        return loads
+
+    @api.model
+    def _allocate(self, loads, sensitive, channel_count):
+        """Return the channel index of each model and the load of each
+        channel, packing the models greedily"""
+        channel_loads = [0.0] * channel_count
+        allocation = {}
+        reserved = sorted(sensitive, key=lambda model: (-loads[model], model))
+        reserved = reserved[: channel_count - 1]
+        for index, model_name in enumerate(reserved):
+            allocation[model_name] = index
+            channel_loads[index] += loads[model_name]
+        pool = range(len(reserved), channel_count)
+        others = set(loads) - set(reserved)
+        for model_name in sorted(others, key=lambda model: (-loads[model], model)):
+            index = min(pool, key=lambda i: (channel_loads[i], i))
+            allocation[model_name] = index
+            channel_loads[index] += loads[model_name]
+        return allocation, channel_loads
+
+    def _get_capacity(self, load):
+        """Number of workers needed by a channel for its load"""
+        utilisation = load / (self.days * 24 * 3600.0)
+        return max(1, math.ceil(utilisation * CAPACITY_HEADROOM))
+
+    def action_compute(self):
+        self.ensure_one()
+        stats = self._get_model_loads()
+        sensitive = [
+            model_name
+            for model_name in stats
+            if self.env[model_name]._priority <= LATENCY_SENSITIVE_PRIORITY
+        ]
+        allocation, channel_loads = self._allocate(
+            {model_name: values["load"] for model_name, values in stats.items()},
+            sensitive,
+            max(1, self.channel_count),
+        )
+        capacities = [self._get_capacity(load) for load in channel_loads]
+        lines = [(5, 0, 0)]
+        for model_name, values in sorted(stats.items()):
+            index = allocation[model_name]
+            lines.append(
+                (
+                    0,
+                    0,
+                    dict(
+                        values,
+                        model_name=model_name,
+                        current_channel=self.env[model_name]._get_channel_name(
+                            self.backend_id
+                        ),
+                        channel="root.{}".format(index),
+                        channel_capacity=capacities[index],
+                    ),
+                )
+            )
+        self.write(
+            {
+                "line_ids": lines,
+                "channel_config": ",".join(
+                    ["root:{}".format(sum(capacities))]
+                    + [
+                        "root.{}:{}".format(index, capacity)
+                        for index, capacity in enumerate(capacities)
+                    ]
+                ),
+            }
+        )
+        return self._reopen()
+
+    def action_apply(self):
+        """Assign the binding models to the proposed channels"""
+        self.ensure_one()
+        assignments = self.env["odoo.channel.assignment"]
+        existing = {
+            assignment.model_name: assignment
+            for assignment in assignments.search(
+                [("backend_id", "=", self.backend_id.id)]
+            )
+        }
+        for line in self.line_ids:
+            if line.model_name in existing:
+                existing[line.model_name].write({"channel": line.channel})
+            else:
+                assignments.create(
+                    {
+                        "backend_id": self.backend_id.id,
+                        "model_name": line.model_name,
+                        "channel": line.channel,
+                    }
+                )
+        return self._reopen()
+
+    def _reopen(self):
+        return {
+            "type": "ir.actions.act_window",
+            "name": _("Channel Allocation"),
+            "res_model": self._name,
+            "res_id": self.id,
+            "view_mode": "form",
+            "target": "new",
+        }
+
+
+class OdooChannelAllocationLine(models.TransientModel):
+    _name = "odoo.channel.allocation.line"
+    _description = "Odoo Job Channel Allocation Line"
+    _order = "channel, load desc"
+
+    wizard_id = fields.Many2one(
+        "odoo.channel.allocation.wizard", required=True, ondelete="cascade"
+    )
+    model_name = fields.Char(string="Binding Model", readonly=True)
+    job_count = fields.Integer(string="Jobs", readonly=True)
+    avg_duration = fields.Float(string="Average Time (s)", readonly=True)
+    total_duration = fields.Float(string="Total Time (s)", readonly=True)
+    pending_count = fields.Integer(string="Waiting Jobs", readonly=True)
+    load = fields.Float(string="Load (s)", readonly=True)
+    current_channel = fields.Char(readonly=True)
+    channel = fields.Char(string="Proposed Channel")
+    channel_capacity = fields.Integer(string="Proposed Capacity", readonly=True)